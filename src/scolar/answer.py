@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import heapq
 import logging
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from textwrap import dedent
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Final
 
-from openai import AsyncOpenAI
+import orjson
+from openai import AsyncOpenAI, OpenAIError
 
+from .cache import parse_cache_timestamp, read_cache_file, write_cache_file
 from .config import Settings
 from .pipeline import ProcessedPage
 
 logger = logging.getLogger(__name__)
 
+_ANSWER_CACHE_DIRNAME: Final[str] = "answers"
+
 
 SYNTHESIS_SYSTEM_PROMPT = (
     "You are an expert research synthesizer. Combine evidence from provided pages "
@@ -18,6 +28,42 @@ SYNTHESIS_SYSTEM_PROMPT = (
     "uncertainties."
 )
 
+_PAGE_TEMPLATE = """\
+Page {index}: {title}
+URL: {url}
+Prompt fit: {fit_rating}/5 - {fit_justification}
+Technical depth: {depth_rating}/5 - {depth_justification}
+Summary: {summary}
+Content excerpt:
+---
+{excerpt}
+---"""
+
+_USER_PROMPT_TEMPLATE = """\
+Research prompt:
+{research_prompt}
+
+The following page digests are ordered from most relevant to least, based on the
+prompt fit and technical depth ratings. Use only this evidence to answer the
+research prompt. Cite supporting material inline using the notation (Page N).
+If the information is insufficient, state the gaps explicitly.
+
+Page digests:
+{context}
+
+Respond in markdown with the following structure:
+## Answer
+<direct response>
+
+## Evidence
+- <bullet points referencing Page N>
+
+## Remaining Gaps
+<short explanation or "None">
+
+## Suggest Follow-up Questions
+- <bullet points with suggested Questions>"""
+
 
 @dataclass(slots=True)
 class SynthesisResult:
@@ -25,14 +71,77 @@ class SynthesisResult:
     ordered_pages: list[ProcessedPage]
 
 
-def _ordered_pages(pages: list[ProcessedPage]) -> list[ProcessedPage]:
-    return sorted(
+@dataclass(slots=True)
+class CachedAnswer:
+    answer: str
+    created_at: datetime
+
+
+class AnswerCache:
+    """Disk cache of synthesized answers keyed on the exact model request."""
+
+    def __init__(self, settings: Settings) -> None:
+        self._settings = settings
+        cache_root = settings.output_dir / "_cache" / _ANSWER_CACHE_DIRNAME
+        cache_root.mkdir(parents=True, exist_ok=True)
+        self._cache_dir = cache_root
+        self._ttl = timedelta(hours=settings.answer_cache_ttl_hours)
+
+    def request_key(self, user_prompt: str) -> str:
+        material = "\n".join(
+            (
+                self._settings.openai_model,
+                repr(self._settings.openai_temperature),
+                SYNTHESIS_SYSTEM_PROMPT,
+                user_prompt,
+            )
+        )
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cache_path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.json"
+
+    def _now(self) -> datetime:
+        return datetime.now(timezone.utc)
+
+    async def load(self, key: str) -> CachedAnswer | None:
+        raw = await asyncio.to_thread(read_cache_file, self._cache_path(key))
+        if raw is None:
+            return None
+
+        try:
+            payload = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            logger.warning("Discarding corrupt answer cache entry %s", key)
+            return None
+
+        created_at = parse_cache_timestamp(payload.get("created_at"))
+        answer = payload.get("answer")
+        if created_at is None or not isinstance(answer, str) or not answer:
+            return None
+
+        if self._now() - created_at > self._ttl:
+            return None
+
+        return CachedAnswer(answer=answer, created_at=created_at)
+
+    async def save(self, *, key: str, answer: str) -> None:
+        payload = {"answer": answer, "created_at": self._now().isoformat()}
+        await asyncio.to_thread(
+            write_cache_file,
+            self._cache_path(key),
+            orjson.dumps(payload),
+        )
+
+
+def _top_pages(pages: list[ProcessedPage], limit: int) -> list[ProcessedPage]:
+    return heapq.nlargest(
+        limit,
         pages,
         key=lambda item: (
             item.assessment.prompt_fit.rating,
             item.assessment.technical_depth.rating,
         ),
-        reverse=True,
     )
 
 
@@ -48,23 +157,20 @@ def _excerpt(markdown: str, limit: int) -> str:
 
 
 def _build_context(pages: list[ProcessedPage], limit: int) -> str:
-    sections: list[str] = []
-    for index, item in enumerate(pages, start=1):
-        block = dedent(
-            f"""
-            Page {index}: {item.page.title}
-            URL: {item.page.url}
-            Prompt fit: {item.assessment.prompt_fit.rating}/5 - {item.assessment.prompt_fit.justification}
-            Technical depth: {item.assessment.technical_depth.rating}/5 - {item.assessment.technical_depth.justification}
-            Summary: {item.assessment.summary}
-            Content excerpt:
-            ---
-            {_excerpt(item.page.markdown, limit)}
-            ---
-            """
-        ).strip()
-        sections.append(block)
-    return "\n\n".join(sections)
+    return "\n\n".join(
+        _PAGE_TEMPLATE.format(
+            index=index,
+            title=item.page.title,
+            url=item.page.url,
+            fit_rating=item.assessment.prompt_fit.rating,
+            fit_justification=item.assessment.prompt_fit.justification,
+            depth_rating=item.assessment.technical_depth.rating,
+            depth_justification=item.assessment.technical_depth.justification,
+            summary=item.assessment.summary,
+            excerpt=_excerpt(item.page.markdown, limit),
+        )
+        for index, item in enumerate(pages, start=1)
+    )
 
 
 async def synthesize_answer(
@@ -72,53 +178,65 @@ async def synthesize_answer(
     settings: Settings,
     research_prompt: str,
     pages: list[ProcessedPage],
+    *,
+    on_token: Callable[[str], Awaitable[None]] | None = None,
+    refresh_cache: bool = False,
+    cache: AnswerCache | None = None,
 ) -> SynthesisResult | None:
+    """Synthesize a final answer from the highest-ranked pages.
+
+    When ``on_token`` is provided the response is streamed and each text delta
+    is forwarded to it as soon as it arrives. Answers are cached per exact
+    request; ``refresh_cache`` skips the lookup but still stores the result.
+    """
+
     if not pages:
         logger.warning("Requested synthesis with no pages available")
         return None
 
-    ordered = _ordered_pages(pages)
-    selected = ordered[: settings.final_answer_max_pages]
+    selected = _top_pages(pages, settings.final_answer_max_pages)
 
     context = _build_context(selected, settings.final_answer_excerpt_chars)
-    user_prompt = dedent(
-        f"""
-        Research prompt:
-        {research_prompt}
-
-        The following page digests are ordered from most relevant to least, based on the
-        prompt fit and technical depth ratings. Use only this evidence to answer the
-        research prompt. Cite supporting material inline using the notation (Page N).
-        If the information is insufficient, state the gaps explicitly.
-
-        Page digests:
-        {context}
-
-        Respond in markdown with the following structure:
-        ## Answer
-        <direct response>
-
-        ## Evidence
-        - <bullet points referencing Page N>
-
-        ## Remaining Gaps
-        <short explanation or "None">
+    user_prompt = _USER_PROMPT_TEMPLATE.format(
+        research_prompt=research_prompt, context=context
+    )
 
-        ## Suggest Follow-up Questions
-        - <bullet points with suggested Questions>
-        """
-    ).strip()
+    cache_obj = cache if cache is not None else AnswerCache(settings)
+    cache_key = cache_obj.request_key(user_prompt)
+    if not refresh_cache:
+        cached = await cache_obj.load(cache_key)
+        if cached:
+            logger.info("Using cached synthesis from %s", cached.created_at.isoformat())
+            if on_token is not None:
+                await on_token(cached.answer)
+            return SynthesisResult(answer=cached.answer, ordered_pages=selected)
 
     try:
-        response = await client.responses.create(
-            model=settings.openai_model,
-            temperature=settings.openai_temperature,
-            input=[
-                {"role": "system", "content": SYNTHESIS_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt},
-            ],
-        )
-    except Exception as exc:  # noqa: BLE001
+        if on_token is None:
+            response = await client.responses.create(
+                model=settings.openai_model,
+                temperature=settings.openai_temperature,
+                input=[
+                    {"role": "system", "content": SYNTHESIS_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt},
+                ],
+            )
+        else:
+            async with client.responses.stream(
+                model=settings.openai_model,
+                temperature=settings.openai_temperature,
+                input=[
+                    {"role": "system", "content": SYNTHESIS_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt},
+                ],
+            ) as stream:
+                async for event in stream:
+                    if event.type == "response.output_text.delta":
+                        await on_token(event.delta)
+                response = await stream.get_final_response()
+    except OpenAIError as exc:
+        # Only SDK errors (which wrap transport failures) are swallowed; errors
+        # raised by the caller's ``on_token`` callback propagate.
         logger.error("OpenAI synthesis request failed: %s", exc)
         return None
 
@@ -129,7 +247,17 @@ async def synthesize_answer(
         logger.error("Empty synthesis response from model")
         return None
 
+    try:
+        await cache_obj.save(key=cache_key, answer=raw_output)
+    except OSError as exc:
+        logger.warning("Failed to cache synthesized answer %s: %s", cache_key, exc)
     return SynthesisResult(answer=raw_output, ordered_pages=selected)
 
 
-__all__ = ["SYNTHESIS_SYSTEM_PROMPT", "SynthesisResult", "synthesize_answer"]
+__all__ = [
+    "SYNTHESIS_SYSTEM_PROMPT",
+    "AnswerCache",
+    "CachedAnswer",
+    "SynthesisResult",
+    "synthesize_answer",
+]
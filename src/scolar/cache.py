@@ -2,24 +2,82 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-import json
 import logging
-from dataclasses import dataclass
+import os
+import tempfile
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
+from functools import lru_cache
+from pathlib import Path, PurePath
+
+import orjson
 
 from .config import Settings
 from .models import (
     PageAssessment,
     PageContent,
-    assessment_to_dict,
     dict_to_assessment,
     dict_to_page,
-    page_to_dict,
 )
 
 logger = logging.getLogger(__name__)
 
+_LOAD_MANY_CONCURRENCY = 32
+
+
+@lru_cache(maxsize=4096)
+def cache_key_digest(key: str) -> str:
+    """Return the (memoized) hex digest that names the cache entry for ``key``."""
+
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _encode_path(value: object) -> str:
+    # orjson serializes the page/assessment dataclasses natively; paths are
+    # the only field type it needs help with.
+    if isinstance(value, PurePath):
+        return str(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__} to JSON")
+
+
+def parse_cache_timestamp(value: object) -> datetime | None:
+    """Parse a stored ISO-8601 timestamp as an aware UTC datetime, if valid."""
+
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def read_cache_file(path: Path) -> bytes | None:
+    """Return the raw bytes of a cache entry, or ``None`` when it does not exist."""
+
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def write_cache_file(path: Path, data: bytes) -> None:
+    """Atomically replace a cache entry so readers never observe partial writes."""
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.stem}-", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
 
 @dataclass(slots=True)
 class CachedPage:
@@ -36,34 +94,27 @@ class PageCache:
         self._cache_dir.mkdir(parents=True, exist_ok=True)
 
     def _cache_path(self, url: str) -> Path:
-        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
-        return self._cache_dir / f"{digest}.json"
+        return self._cache_dir / f"{cache_key_digest(url)}.json"
 
     def _now(self) -> datetime:
         return datetime.now(timezone.utc)
 
     async def load(self, url: str) -> CachedPage | None:
         path = self._cache_path(url)
-        if not path.exists():
+        raw = await asyncio.to_thread(read_cache_file, path)
+        if raw is None:
             return None
 
         try:
-            raw_text = await asyncio.to_thread(path.read_text, encoding="utf-8")
-            payload = json.loads(raw_text)
-        except FileNotFoundError:
-            return None
-        except json.JSONDecodeError:
+            payload = orjson.loads(raw)
+        except orjson.JSONDecodeError:
             logger.warning("Discarding corrupt cache entry for %s", url)
             return None
 
-        fetched_raw = payload.get("fetched_at")
-        if not fetched_raw:
+        fetched_at = parse_cache_timestamp(payload.get("fetched_at"))
+        if fetched_at is None:
             return None
 
-        fetched_at = datetime.fromisoformat(fetched_raw)
-        if fetched_at.tzinfo is None:
-            fetched_at = fetched_at.replace(tzinfo=timezone.utc)
-
         if self._now() - fetched_at > self._ttl:
             return None
 
@@ -80,32 +131,54 @@ class PageCache:
         assessment = dict_to_assessment(assessment_data)
         return CachedPage(page=page, assessment=assessment, fetched_at=fetched_at)
 
+    async def load_many(self, urls: Iterable[str]) -> dict[str, CachedPage | None]:
+        """Load several entries concurrently, keyed by URL in input order.
+
+        Prefer a single call over awaiting ``load`` per URL so disk reads for a
+        batch of URLs overlap instead of running back to back.
+        """
+
+        semaphore = asyncio.Semaphore(_LOAD_MANY_CONCURRENCY)
+
+        async def _load_one(url: str) -> tuple[str, CachedPage | None]:
+            async with semaphore:
+                return url, await self.load(url)
+
+        pairs = await asyncio.gather(*(_load_one(url) for url in urls))
+        return dict(pairs)
+
     async def save(
         self, *, url: str, page: PageContent, assessment: PageAssessment
     ) -> None:
-        page_dict = page_to_dict(page)
-        markdown_path_raw = page_dict.get("markdown_path")
-        if isinstance(markdown_path_raw, (str, Path)) and markdown_path_raw:
-            path_obj = Path(markdown_path_raw)
+        stored_page = page
+        if page.markdown_path is not None:
             try:
-                relative = path_obj.relative_to(self._settings.output_dir)
-                page_dict["markdown_path"] = str(relative)
+                relative = page.markdown_path.relative_to(self._settings.output_dir)
             except ValueError:
-                page_dict["markdown_path"] = str(path_obj)
+                pass
+            else:
+                stored_page = replace(page, markdown_path=relative)
 
         payload = {
             "url": url,
             "fetched_at": self._now().isoformat(),
-            "page": page_dict,
-            "assessment": assessment_to_dict(assessment),
+            "page": stored_page,
+            "assessment": assessment,
         }
 
         path = self._cache_path(url)
         await asyncio.to_thread(
-            path.write_text,
-            json.dumps(payload, indent=2, ensure_ascii=False),
-            encoding="utf-8",
+            write_cache_file,
+            path,
+            orjson.dumps(payload, default=_encode_path),
         )
 
 
-__all__ = ["CachedPage", "PageCache"]
+__all__ = [
+    "CachedPage",
+    "PageCache",
+    "cache_key_digest",
+    "parse_cache_timestamp",
+    "read_cache_file",
+    "write_cache_file",
+]
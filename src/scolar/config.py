@@ -99,8 +99,13 @@ class Settings(BaseModel):
         ge=1,
         description="Duration in hours that cached fetch results remain valid.",
     )
+    answer_cache_ttl_hours: int = Field(
+        default=24,
+        ge=1,
+        description="Duration in hours that cached synthesized answers remain valid.",
+    )
 
-    model_config = ConfigDict(validate_assignment=True)
+    model_config = ConfigDict(frozen=True)
 
     @field_validator("output_dir", mode="before")
     @classmethod
@@ -110,10 +115,16 @@ class Settings(BaseModel):
         return Path(value).expanduser()
 
 
+_FIELD_NAMES: tuple[str, ...] = tuple(Settings.model_fields)
+
+
 def load_settings() -> Settings:
+    # Dynaconf normalizes keys to upper case; one snapshot avoids a lazy
+    # attribute lookup per field.
+    values = _dynaconf_settings.as_dict()
     raw: dict[str, SettingValue] = {}
-    for field_name in Settings.model_fields:
-        value = _dynaconf_settings.get(field_name, default=None)
+    for field_name in _FIELD_NAMES:
+        value = values.get(field_name.upper())
         if value is not None:
             raw[field_name] = cast(SettingValue, value)
     return Settings.model_validate(raw)
@@ -3,8 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
-import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -12,7 +10,14 @@ from pathlib import Path
 from typing import Final, Protocol
 
 import httpx
-
+import orjson
+
+from .cache import (
+    cache_key_digest,
+    parse_cache_timestamp,
+    read_cache_file,
+    write_cache_file,
+)
 from .config import Settings
 
 logger = logging.getLogger(__name__)
@@ -33,7 +38,8 @@ class SearchHit:
 class SupportsHttpResponse(Protocol):
     def raise_for_status(self) -> None: ...
 
-    def json(self) -> object: ...
+    @property
+    def content(self) -> bytes: ...
 
 
 class SupportsAsyncGet(Protocol):
@@ -56,34 +62,27 @@ class SearchHitCache:
         self._ttl = ttl if ttl is not None else _DEFAULT_SEARCH_TTL
 
     def _cache_path(self, prompt: str) -> Path:
-        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
-        return self._cache_dir / f"{digest}.json"
+        return self._cache_dir / f"{cache_key_digest(prompt)}.json"
 
     def _now(self) -> datetime:
         return datetime.now(timezone.utc)
 
     async def load(self, prompt: str) -> SearchHit | None:
         path = self._cache_path(prompt)
-        if not path.exists():
+        raw = await asyncio.to_thread(read_cache_file, path)
+        if raw is None:
             return None
 
         try:
-            raw_text = await asyncio.to_thread(path.read_text, encoding="utf-8")
-            payload = json.loads(raw_text)
-        except FileNotFoundError:
-            return None
-        except json.JSONDecodeError:
+            payload = orjson.loads(raw)
+        except orjson.JSONDecodeError:
             logger.warning("Discarding corrupt search cache entry for %r", prompt)
             return None
 
-        fetched_raw = payload.get("fetched_at")
-        if not fetched_raw:
+        fetched_at = parse_cache_timestamp(payload.get("fetched_at"))
+        if fetched_at is None:
             return None
 
-        fetched_at = datetime.fromisoformat(fetched_raw)
-        if fetched_at.tzinfo is None:
-            fetched_at = fetched_at.replace(tzinfo=timezone.utc)
-
         if self._now() - fetched_at > self._ttl:
             return None
 
@@ -109,27 +108,22 @@ class SearchHitCache:
         }
         path = self._cache_path(prompt)
         await asyncio.to_thread(
-            path.write_text,
-            json.dumps(payload, indent=2, ensure_ascii=False),
-            encoding="utf-8",
+            write_cache_file,
+            path,
+            orjson.dumps(payload),
         )
 
 
 def _dedupe_urls(urls: list[str], *, limit: int) -> list[str]:
-    seen: set[str] = set()
-    result: list[str] = []
+    # Keyed on the lowercased URL so the first spelling seen wins.
+    seen: dict[str, str] = {}
     for url in urls:
         normalized = url.strip()
-        if not normalized:
-            continue
-        lowered = normalized.lower()
-        if lowered in seen:
-            continue
-        seen.add(lowered)
-        result.append(normalized)
-        if len(result) >= limit:
-            break
-    return result
+        if normalized and (lowered := normalized.lower()) not in seen:
+            seen[lowered] = normalized
+            if len(seen) >= limit:
+                break
+    return list(seen.values())
 
 
 async def _search_reddit_localllama(
@@ -167,8 +161,8 @@ async def _search_reddit_localllama(
         return []
 
     try:
-        data = response.json()
-    except json.JSONDecodeError:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
         logger.error("Failed to decode Reddit search response for %r", prompt)
         return []
 
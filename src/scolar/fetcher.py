@@ -2,25 +2,36 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Mapping
+import random
 from dataclasses import dataclass
-from json import JSONDecodeError
-from urllib.parse import ParseResult, urlparse, urlunparse
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Final
 
 import httpx
+import orjson
 
 from .config import Settings
 
 logger = logging.getLogger(__name__)
 
+_MAX_BACKOFF_SECONDS: Final[float] = 30.0
+_RETRY_AFTER_STATUSES: Final[frozenset[int]] = frozenset({429, 503})
+# Reddit bodies above this size are parsed in a worker thread; below it the
+# thread hop costs more than the parse itself.
+_OFFLOAD_DECODE_BYTES: Final[int] = 64 * 1024
 
-@dataclass(slots=True)
+
+# Fetch results are compared by identity only; a generated __eq__ would walk
+# entire comment trees.
+@dataclass(slots=True, eq=False, match_args=False)
 class HtmlDocument:
     url: str
     html: str
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, eq=False, match_args=False)
 class RedditComment:
     identifier: str
     author: str | None
@@ -29,7 +40,7 @@ class RedditComment:
     children: list["RedditComment"]
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, eq=False, match_args=False)
 class RedditThread:
     identifier: str
     url: str
@@ -43,6 +54,25 @@ class RedditThread:
 FetchResult = HtmlDocument | RedditThread
 
 
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    """Parse a ``Retry-After`` header given as delta-seconds or an HTTP-date."""
+
+    value = response.headers.get("retry-after", "").strip()
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
 async def _get_with_retries(
     url: str,
     client: httpx.AsyncClient,
@@ -52,26 +82,28 @@ async def _get_with_retries(
 ) -> httpx.Response | None:
     attempt = 0
     max_attempts = settings.request_retries + 1
-    backoff = settings.request_backoff
+    # Jitter spreads out concurrent retries against the same host.
+    delays = [
+        min(
+            settings.request_backoff * 2 ** min(index, 16) * (0.5 + random.random()),
+            _MAX_BACKOFF_SECONDS,
+        )
+        for index in range(settings.request_retries)
+    ]
+    headers = {"User-Agent": settings.user_agent}
+    timeout = settings.request_timeout
+    client_get = client.get
 
     while attempt < max_attempts:
         attempt += 1
+        retry_after: float | None = None
         try:
             logger.info("Fetching %s (attempt %s/%s)", url, attempt, max_attempts)
-            headers = {"User-Agent": settings.user_agent}
             if semaphore:
                 async with semaphore:
-                    response = await client.get(
-                        url,
-                        headers=headers,
-                        timeout=settings.request_timeout,
-                    )
+                    response = await client_get(url, headers=headers, timeout=timeout)
             else:
-                response = await client.get(
-                    url,
-                    headers=headers,
-                    timeout=settings.request_timeout,
-                )
+                response = await client_get(url, headers=headers, timeout=timeout)
 
             response.raise_for_status()
             return response
@@ -86,6 +118,8 @@ async def _get_with_retries(
             status = exc.response.status_code
             if 400 <= status < 500 and status != 429:
                 return None
+            if status in _RETRY_AFTER_STATUSES:
+                retry_after = _retry_after_seconds(exc.response)
         except httpx.RequestError as exc:
             logger.warning(
                 "Request error fetching %s (attempt %s/%s): %s",
@@ -96,13 +130,28 @@ async def _get_with_retries(
             )
 
         if attempt < max_attempts:
-            await asyncio.sleep(backoff if backoff > 0 else 0)
-            backoff *= 2
+            delay = delays[attempt - 1]
+            # Never undercut an explicit server-provided Retry-After.
+            if retry_after is not None:
+                delay = min(max(delay, retry_after), _MAX_BACKOFF_SECONDS)
+            await asyncio.sleep(delay)
 
     logger.error("Failed to fetch %s after %s attempts", url, max_attempts)
     return None
 
 
+def _decode_body(content: bytes, content_type: str) -> str:
+    """Decode a body using its declared charset, skipping httpx's detection."""
+
+    # Parameter names are case-insensitive, so match ``Charset=`` as well.
+    charset = content_type.lower().partition("charset=")[2].split(";", 1)[0]
+    charset = charset.strip().strip("\"'") or "utf-8"
+    try:
+        return content.decode(charset, errors="replace")
+    except LookupError:
+        return content.decode("utf-8", errors="replace")
+
+
 async def fetch_html(
     url: str,
     client: httpx.AsyncClient,
@@ -128,35 +177,55 @@ async def fetch_html(
         )
         return None
 
-    return response.text
+    return _decode_body(response.content, content_type)
 
 
+@lru_cache(maxsize=4096)
 def _is_reddit_url(url: str) -> bool:
-    parsed = urlparse(url)
-    hostname = parsed.hostname or ""
-    return hostname.endswith("reddit.com")
+    # Plain string slicing is enough to isolate the host and avoids building a
+    # full ParseResult for every candidate URL.
+    rest = url.partition("://")[2]
+    authority = rest.partition("/")[0].partition("?")[0].partition("#")[0]
+    host = authority.rpartition("@")[2].partition(":")[0].lower()
+    return host == "reddit.com" or host.endswith(".reddit.com")
 
 
+@lru_cache(maxsize=4096)
 def _normalize_reddit_json_url(url: str) -> str:
-    parsed = urlparse(url)
-    path = parsed.path or "/"
-    if not path.endswith("/"):
-        path = f"{path}/"
+    scheme, separator, rest = url.partition("://")
+    if not separator:
+        scheme, rest = "https", url
+    rest = rest.partition("?")[0].partition("#")[0]
+    host, _, path = rest.partition("/")
+    path = "/" + path
     if not path.endswith(".json"):
+        if not path.endswith("/"):
+            path = f"{path}/"
         path = f"{path}.json"
-
-    sanitized = ParseResult(
-        scheme=parsed.scheme or "https",
-        netloc=parsed.netloc,
-        path=path,
-        params="",
-        query="",
-        fragment="",
-    )
-    return urlunparse(sanitized)
-
-
-def _parse_reddit_comment(payload: Mapping[str, object]) -> RedditComment:
+    return f"{scheme or 'https'}://{host}{path}"
+
+
+def _reply_payloads(replies: object) -> list[dict[str, object]]:
+    if not isinstance(replies, dict):
+        return []
+    data = replies.get("data")
+    if not isinstance(data, dict):
+        return []
+    raw_children = data.get("children")
+    if not isinstance(raw_children, list):
+        return []
+
+    payloads: list[dict[str, object]] = []
+    for entry in raw_children:
+        if not isinstance(entry, dict) or entry.get("kind") != "t1":
+            continue
+        comment_data = entry.get("data")
+        if isinstance(comment_data, dict):
+            payloads.append(comment_data)
+    return payloads
+
+
+def _new_reddit_comment(payload: dict[str, object]) -> RedditComment:
     identifier = str(payload.get("id", ""))
     author_value = payload.get("author")
     author = (
@@ -169,52 +238,33 @@ def _parse_reddit_comment(payload: Mapping[str, object]) -> RedditComment:
     body_html_raw = payload.get("body_html")
     body_html = str(body_html_raw) if isinstance(body_html_raw, str) else ""
 
-    children: list[RedditComment] = []
-    replies = payload.get("replies")
-    if isinstance(replies, Mapping):
-        data = replies.get("data")
-        if isinstance(data, Mapping):
-            raw_children = data.get("children")
-            if isinstance(raw_children, list):
-                for entry in raw_children:
-                    if not isinstance(entry, Mapping):
-                        continue
-                    kind = entry.get("kind")
-                    if kind != "t1":
-                        continue
-                    comment_data = entry.get("data")
-                    if isinstance(comment_data, Mapping):
-                        children.append(_parse_reddit_comment(comment_data))
-
     return RedditComment(
         identifier=identifier,
         author=author,
         body_html=body_html,
         score=score,
-        children=children,
+        children=[],
     )
 
 
-async def fetch_reddit(
-    url: str,
-    client: httpx.AsyncClient,
-    settings: Settings,
-    *,
-    semaphore: asyncio.Semaphore | None = None,
-) -> RedditThread | None:
-    json_url = _normalize_reddit_json_url(url)
-    response = await _get_with_retries(
-        json_url,
-        client,
-        settings,
-        semaphore=semaphore,
-    )
-    if response is None:
-        return None
+def _parse_reddit_comment(payload: dict[str, object]) -> RedditComment:
+    # Walk the reply tree with an explicit stack so deeply nested threads
+    # cannot hit the interpreter recursion limit.
+    root = _new_reddit_comment(payload)
+    stack = [(root, payload)]
+    while stack:
+        node, node_payload = stack.pop()
+        for child_payload in _reply_payloads(node_payload.get("replies")):
+            child = _new_reddit_comment(child_payload)
+            node.children.append(child)
+            stack.append((child, child_payload))
+    return root
 
+
+def _build_reddit_thread(url: str, content: bytes) -> RedditThread | None:
     try:
-        payload = response.json()
-    except (JSONDecodeError, ValueError) as exc:
+        payload = orjson.loads(content)
+    except orjson.JSONDecodeError as exc:
         logger.error("Failed to decode Reddit JSON for %s: %s", url, exc)
         return None
 
@@ -224,14 +274,12 @@ async def fetch_reddit(
 
     post_listing = payload[0]
     comments_listing = payload[1]
-    if not isinstance(post_listing, Mapping) or not isinstance(
-        comments_listing, Mapping
-    ):
+    if not isinstance(post_listing, dict) or not isinstance(comments_listing, dict):
         logger.error("Unexpected Reddit listing format for %s", url)
         return None
 
     post_children = post_listing.get("data")
-    if not isinstance(post_children, Mapping):
+    if not isinstance(post_children, dict):
         logger.error("Missing Reddit post data for %s", url)
         return None
     post_items = post_children.get("children")
@@ -239,11 +287,11 @@ async def fetch_reddit(
         logger.error("Empty Reddit post listing for %s", url)
         return None
     first_item = post_items[0]
-    if not isinstance(first_item, Mapping):
+    if not isinstance(first_item, dict):
         logger.error("Invalid Reddit post entry for %s", url)
         return None
     post_data = first_item.get("data")
-    if not isinstance(post_data, Mapping):
+    if not isinstance(post_data, dict):
         logger.error("Missing Reddit post details for %s", url)
         return None
 
@@ -261,19 +309,10 @@ async def fetch_reddit(
     score_value = post_data.get("score")
     score = int(score_value) if isinstance(score_value, int) else None
 
-    comments: list[RedditComment] = []
-    comments_data = comments_listing.get("data")
-    if isinstance(comments_data, Mapping):
-        comment_children = comments_data.get("children")
-        if isinstance(comment_children, list):
-            for entry in comment_children:
-                if not isinstance(entry, Mapping):
-                    continue
-                if entry.get("kind") != "t1":
-                    continue
-                comment_payload = entry.get("data")
-                if isinstance(comment_payload, Mapping):
-                    comments.append(_parse_reddit_comment(comment_payload))
+    comments = [
+        _parse_reddit_comment(comment_payload)
+        for comment_payload in _reply_payloads(comments_listing)
+    ]
 
     return RedditThread(
         identifier=identifier,
@@ -286,6 +325,31 @@ async def fetch_reddit(
     )
 
 
+async def fetch_reddit(
+    url: str,
+    client: httpx.AsyncClient,
+    settings: Settings,
+    *,
+    semaphore: asyncio.Semaphore | None = None,
+) -> RedditThread | None:
+    json_url = _normalize_reddit_json_url(url)
+    response = await _get_with_retries(
+        json_url,
+        client,
+        settings,
+        semaphore=semaphore,
+    )
+    if response is None:
+        return None
+
+    content = response.content
+    if len(content) > _OFFLOAD_DECODE_BYTES:
+        # Decode and build the comment tree in one worker-thread hop so large
+        # threads never block other in-flight fetches.
+        return await asyncio.to_thread(_build_reddit_thread, url, content)
+    return _build_reddit_thread(url, content)
+
+
 async def fetch_resource(
     url: str,
     client: httpx.AsyncClient,
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import logging
 import sys
 from collections.abc import Iterable
@@ -10,6 +9,7 @@ from pathlib import Path
 from typing import cast
 
 import httpx
+import orjson
 from openai import AsyncOpenAI
 
 from .answer import synthesize_answer
@@ -36,15 +36,10 @@ def _read_urls(urls: Iterable[str], urls_file: Path | None) -> list[str]:
     collection: list[str] = list(urls)
     if urls_file:
         content = urls_file.read_text(encoding="utf-8")
-        file_urls = [line.strip() for line in content.splitlines() if line.strip()]
-        collection.extend(file_urls)
-    deduped: list[str] = []
-    seen = set()
-    for url in collection:
-        if url not in seen:
-            seen.add(url)
-            deduped.append(url)
-    return deduped
+        for line in content.splitlines():
+            if line := line.strip():
+                collection.append(line)
+    return list(dict.fromkeys(collection))
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -101,12 +96,23 @@ async def run_async(args: argparse.Namespace) -> int:
 
     settings = load_settings()
     if args.output_dir:
-        settings.output_dir = args.output_dir.expanduser()
+        settings = settings.model_copy(
+            update={"output_dir": args.output_dir.expanduser()}
+        )
 
     urls = _read_urls(args.urls, args.urls_file)
     result: ResearchResult | None = None
+    # Size the pool to the fetch fan-out so concurrent fetches reuse warm
+    # connections (multiplexed over HTTP/2 where the host supports it).
+    pool_size = settings.fetch_concurrency * 2
     async with httpx.AsyncClient(
-        headers={"User-Agent": settings.user_agent}
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=30.0,
+        ),
+        headers={"User-Agent": settings.user_agent},
     ) as http_client:
         llm_client = AsyncOpenAI(timeout=settings.openai_timeout)
         try:
@@ -154,38 +160,34 @@ async def run_async(args: argparse.Namespace) -> int:
 
     if synthesis:
         prioritized = list(synthesis.ordered_pages)
-        prioritized_ids = {id(item) for item in prioritized}
+        prioritized_ids = set(map(id, prioritized))
         remaining = [
             item for item in result.processed_pages if id(item) not in prioritized_ids
         ]
         ordered_results = prioritized + remaining
 
-    if synthesis:
         lines = ["# Final Answer", "", synthesis.answer.strip()]
         if synthesis.ordered_pages:
             lines.extend(["", "## Sources Consulted"])
-            for index, item in enumerate(synthesis.ordered_pages, start=1):
-                lines.append(
-                    (
-                        f"- Page {index}: {item.page.title} ({item.page.url}) - "
-                        f"prompt fit {item.assessment.prompt_fit.rating}/5, "
-                        f"technical depth {item.assessment.technical_depth.rating}/5"
-                    )
-                )
+            lines.extend(
+                f"- Page {index}: {item.page.title} ({item.page.url}) - "
+                f"prompt fit {item.assessment.prompt_fit.rating}/5, "
+                f"technical depth {item.assessment.technical_depth.rating}/5"
+                for index, item in enumerate(synthesis.ordered_pages, start=1)
+            )
         sections.append("\n".join(lines).strip())
 
-    if ordered_results:
-        sections.extend(
-            render_report(item.page, item.assessment) for item in ordered_results
-        )
+    write_json = bool(args.json_output) and result.exit_code == 0
+    page_records: list[dict[str, object]] = []
+    for item in ordered_results:
+        sections.append(render_report(item.page, item.assessment))
+        if write_json:
+            page_records.append(build_json_record(item.page, item.assessment))
 
     if sections:
-        if len(sections) == 1:
-            print(sections[0])
-        else:
-            print(separator.join(sections))
+        print(separator.join(sections))
 
-    if args.json_output and result.exit_code == 0:
+    if write_json:
         payload = {
             "prompt": args.prompt,
             "final_answer": synthesis.answer if synthesis else None,
@@ -201,19 +203,14 @@ async def run_async(args: argparse.Namespace) -> int:
             ]
             if synthesis
             else [],
-            "pages": [
-                build_json_record(item.page, item.assessment)
-                for item in ordered_results
-            ],
+            "pages": page_records,
             "search_queries": (
                 result.search_plan.to_dict() if result.search_plan else None
             ),
         }
         json_path = args.json_output.expanduser()
         json_path.parent.mkdir(parents=True, exist_ok=True)
-        json_path.write_text(
-            json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        json_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
         logger.info("Wrote JSON summary to %s", json_path)
 
     return result.exit_code
@@ -135,18 +135,20 @@ def assessment_to_dict(assessment: PageAssessment) -> dict[str, object]:
 
 
 def dict_to_page(payload: Mapping[str, Any]) -> PageContent:
+    # Cache entries are written by ``PageCache.save``, so fields already carry
+    # the right types and are used as-is.
     markdown_path_raw = payload.get("markdown_path")
     markdown_path = Path(markdown_path_raw) if markdown_path_raw else None
 
     return PageContent(
-        url=str(payload["url"]),
-        title=str(payload["title"]),
-        markdown=str(payload["markdown"]),
+        url=payload["url"],
+        title=payload["title"],
+        markdown=payload["markdown"],
         links=[
-            LinkInfo(title=str(item["title"]), url=str(item["url"]))
-            for item in payload.get("links", [])
+            LinkInfo(title=item["title"], url=item["url"])
+            for item in payload.get("links", ())
         ],
-        truncated=bool(payload.get("truncated", False)),
+        truncated=payload.get("truncated", False),
         markdown_path=markdown_path,
     )
 
@@ -156,21 +158,17 @@ def dict_to_assessment(payload: Mapping[str, Any]) -> PageAssessment:
     prompt_fit = payload.get("prompt_fit", {})
 
     return PageAssessment(
-        summary=str(payload.get("summary", "")),
+        summary=payload.get("summary", ""),
         technical_depth=Score(
-            rating=int(technical.get("rating", 0)),
-            justification=str(technical.get("justification", "")),
+            rating=technical.get("rating", 0),
+            justification=technical.get("justification", ""),
         ),
         prompt_fit=Score(
-            rating=int(prompt_fit.get("rating", 0)),
-            justification=str(prompt_fit.get("justification", "")),
+            rating=prompt_fit.get("rating", 0),
+            justification=prompt_fit.get("justification", ""),
         ),
         recommended_links=[
-            RecommendedLink(
-                title=str(item["title"]),
-                url=str(item["url"]),
-                reason=str(item["reason"]),
-            )
-            for item in payload.get("recommended_links", [])
+            RecommendedLink(title=item["title"], url=item["url"], reason=item["reason"])
+            for item in payload.get("recommended_links", ())
         ],
     )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import html2text
 from urllib.parse import urljoin
 
@@ -9,14 +9,36 @@ from .config import Settings
 from .models import LinkInfo, PageContent
 
 
+# Only these subtrees feed the page model; skipping the rest (mostly <head>)
+# avoids building nodes that would be thrown away.
+_PARSE_ONLY = SoupStrainer(["title", "a", "body"])
+_ANCHOR_SCAN_FACTOR = 4
+_HTTP_PREFIXES = ("http://", "https://")
+# In-page anchors and script/mail handlers never point at another document.
+_SKIPPED_HREF_PREFIXES = ("#", "javascript:", "mailto:")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def _new_converter() -> html2text.HTML2Text:
+    # HTML2Text accumulates per-document state (abbreviations, list and quote
+    # nesting, pending output), so every page gets its own instance.
+    converter = html2text.HTML2Text()
+    converter.ignore_links = True
+    converter.ignore_images = True
+    converter.body_width = 0
+    return converter
+
+
 def _sanitize_markdown(markdown: str) -> str:
     # Collapse repeated blank lines for readability.
-    return re.sub(r"\n{3,}", "\n\n", markdown).strip()
+    return _BLANK_LINES_RE.sub("\n\n", markdown).strip()
 
 
 def parse_html(url: str, html: str, settings: Settings) -> PageContent:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml", parse_only=_PARSE_ONLY)
 
+    # Strained parsing keeps whole <body> subtrees, so inline scripts and media
+    # still have to go before conversion.
     for tag in soup(["script", "style", "noscript", "svg", "img", "video", "source"]):
         tag.decompose()
 
@@ -25,34 +47,39 @@ def parse_html(url: str, html: str, settings: Settings) -> PageContent:
         title = soup.title.string.strip()
 
     links: list[LinkInfo] = []
-    seen: set[tuple[str, str]] = set()
-    for link in soup.select("a[href]"):
+    seen: set[str] = set()
+    # Anchors beyond a few multiples of the cap are mostly navigation that would
+    # never make the cut, so stop the tree walk early as well.
+    anchors = soup.find_all(
+        "a", href=True, limit=settings.max_links_inspected * _ANCHOR_SCAN_FACTOR
+    )
+    for link in anchors:
         if len(links) >= settings.max_links_inspected:
             break
         href_attr = link.get("href")
         if not href_attr or not isinstance(href_attr, str):
             continue
-        absolute = urljoin(url, href_attr.strip())
-        if not absolute.startswith(("http://", "https://")):
+        href = href_attr.strip()
+        if href.startswith(_SKIPPED_HREF_PREFIXES):
             continue
-        text = " ".join(link.get_text(" ", strip=True).split()) or absolute
-        key = (text, absolute)
-        if key in seen:
+        if href.startswith(_HTTP_PREFIXES):
+            absolute = href
+        else:
+            absolute = urljoin(url, href)
+        if not absolute.startswith(_HTTP_PREFIXES) or absolute in seen:
             continue
-        seen.add(key)
+        seen.add(absolute)
+        text = " ".join(link.get_text(" ", strip=True).split()) or absolute
         links.append(LinkInfo(title=text, url=absolute))
 
-    converter = html2text.HTML2Text()
-    converter.ignore_links = True
-    converter.ignore_images = True
-    converter.body_width = 0
-
-    markdown = converter.handle(str(soup.body or soup)).strip()
+    markdown = _new_converter().handle(str(soup.body or soup)).strip()
     markdown = _sanitize_markdown(markdown)
 
     truncated = False
     if len(markdown) > settings.max_markdown_chars:
-        markdown = markdown[: settings.max_markdown_chars].rsplit("\n", 1)[0]
+        limit = settings.max_markdown_chars
+        cut = markdown.rfind("\n", 0, limit)
+        markdown = markdown[: cut if cut >= 0 else limit]
         truncated = True
 
     return PageContent(
@@ -95,13 +95,14 @@ async def gather_pages(
 
     cache = PageCache(settings)
 
-    tasks: list[asyncio.Task[ProcessedPage | None]] = []
-    task_urls: list[str] = []
+    task_urls: dict[asyncio.Task[ProcessedPage | None], str] = {}
     results_by_url: dict[str, ProcessedPage] = {}
 
+    cached_entries = {} if refresh_cache else await cache.load_many(urls)
+
     for url in urls:
         if not refresh_cache:
-            cached = await cache.load(url)
+            cached = cached_entries.get(url)
             if cached:
                 logger.info(
                     "Cache hit for %s (fetched at %s)",
@@ -129,17 +130,17 @@ async def gather_pages(
                 llm_semaphore=llm_semaphore,
             )
         )
-        tasks.append(task)
-        task_urls.append(url)
-
-    if tasks:
-        completed = await asyncio.gather(*tasks, return_exceptions=True)
-        for url, outcome in zip(task_urls, completed, strict=False):
-            if isinstance(outcome, BaseException):
-                logger.error("Unhandled error processing URL %s", url, exc_info=outcome)
-                continue
-            if outcome is None:
-                continue
+        task_urls[task] = url
+
+    # ``return_exceptions`` keeps one failed or cancelled URL from discarding
+    # the pages that did finish; cancelling gather_pages itself still
+    # propagates.
+    outcomes = await asyncio.gather(*task_urls, return_exceptions=True)
+    for url, outcome in zip(task_urls.values(), outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            logger.error("Unhandled error processing URL %s", url, exc_info=outcome)
+            continue
+        if outcome is not None:
             results_by_url[url] = outcome
 
     ordered_results: list[ProcessedPage] = []
@@ -157,7 +158,9 @@ def _convert_reddit_thread(thread: RedditThread, settings: Settings) -> PageCont
 
     truncated = False
     if len(markdown) > settings.max_markdown_chars:
-        markdown = markdown[: settings.max_markdown_chars].rsplit("\n", 1)[0]
+        limit = settings.max_markdown_chars
+        cut = markdown.rfind("\n", 0, limit)
+        markdown = markdown[: cut if cut >= 0 else limit]
         truncated = True
 
     return PageContent(
@@ -5,8 +5,8 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from contextlib import nullcontext
 from dataclasses import dataclass
-from textwrap import dedent
 from typing import Sequence
 
 from openai import AsyncOpenAI
@@ -22,6 +22,32 @@ SEARCH_SYSTEM_PROMPT = (
     "with JSON that follows the requested schema."
 )
 
+_PAYLOAD_SPEC = json.dumps(
+    {
+        "primary_query": "string",
+        "expanded_queries": ["string", "..."],
+        "focus_topics": ["string", "..."],
+        "site_filters": ["site:example.com", "..."],
+        "notes": "string | null",
+    },
+    ensure_ascii=False,
+)
+
+_USER_PROMPT_TEMPLATE = """\
+Research prompt:
+{research_prompt}
+
+Produce JSON that conforms to this schema:
+{payload_spec}
+
+Guidance:
+- primary_query should be the single best general-purpose query for search engines.
+- expanded_queries should list up to {max_queries} diverse variations covering complementary angles.
+- focus_topics should include 3-{max_queries} short keywords or phrases to mix and match.
+- site_filters should include domain or filetype qualifiers when appropriate; return an empty list if none.
+- notes is optional but may contain strategy tips. Use null when no additional guidance is needed.
+Ensure the response is valid JSON and obey the limits."""
+
 
 @dataclass(slots=True)
 class SearchExpansion:
@@ -60,9 +86,10 @@ def _clean_unique(values: Sequence[str], *, limit: int) -> list[str]:
     result: list[str] = []
     for value in values:
         text = value.strip()
-        if not text or text.lower() in seen:
+        lowered = text.lower()
+        if not text or lowered in seen:
             continue
-        seen.add(text.lower())
+        seen.add(lowered)
         result.append(text)
         if len(result) >= limit:
             break
@@ -104,47 +131,14 @@ async def generate_search_queries(
     """Ask the LLM for search queries relevant to the research prompt."""
 
     max_queries = max(settings.final_answer_max_pages, 5)
-    payload_spec = json.dumps(
-        {
-            "primary_query": "string",
-            "expanded_queries": ["string", "..."],
-            "focus_topics": ["string", "..."],
-            "site_filters": ["site:example.com", "..."],
-            "notes": "string | null",
-        },
-        ensure_ascii=False,
+    user_prompt = _USER_PROMPT_TEMPLATE.format(
+        research_prompt=research_prompt,
+        payload_spec=_PAYLOAD_SPEC,
+        max_queries=max_queries,
     )
 
-    user_prompt = dedent(
-        f"""
-        Research prompt:
-        {research_prompt}
-
-        Produce JSON that conforms to this schema:
-        {payload_spec}
-
-        Guidance:
-        - primary_query should be the single best general-purpose query for search engines.
-        - expanded_queries should list up to {max_queries} diverse variations covering complementary angles.
-        - focus_topics should include 3-{max_queries} short keywords or phrases to mix and match.
-        - site_filters should include domain or filetype qualifiers when appropriate; return an empty list if none.
-        - notes is optional but may contain strategy tips. Use null when no additional guidance is needed.
-        Ensure the response is valid JSON and obey the limits.
-        """
-    ).strip()
-
     try:
-        if semaphore:
-            async with semaphore:
-                response = await client.responses.create(
-                    model=settings.openai_model,
-                    temperature=settings.openai_temperature,
-                    input=[
-                        {"role": "system", "content": SEARCH_SYSTEM_PROMPT},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                )
-        else:
+        async with semaphore or nullcontext():
             response = await client.responses.create(
                 model=settings.openai_model,
                 temperature=settings.openai_temperature,
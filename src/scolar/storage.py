@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-import re
+import string
+import unicodedata
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -11,12 +12,20 @@ from .models import PageContent
 
 _MAX_SLUG_LENGTH = 80
 _HASH_LENGTH = 8
-_slug_cleanup = re.compile(r"[^a-z0-9-]+")
+# Output directories already created by this process; every page in a run
+# shares one, so the mkdir syscall only needs to happen once.
+_CREATED_DIRS: set[Path] = set()
+# Slugs are ASCII-only, so a table over the ASCII range drops every character
+# outside ``[a-z0-9-]``.
+_SLUG_ALLOWED = frozenset(string.ascii_lowercase + string.digits + "-")
+_SLUG_TABLE = {code: None for code in range(128) if chr(code) not in _SLUG_ALLOWED}
 
 
 def _slugify(text: str) -> str:
-    base = text.lower().strip().replace(" ", "-")
-    return _slug_cleanup.sub("", base)
+    # Fold accented characters to their ASCII base letters before filtering.
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    base = ascii_text.lower().strip().replace(" ", "-")
+    return base.translate(_SLUG_TABLE)
 
 
 def _base_slug(page: PageContent) -> str:
@@ -37,7 +46,9 @@ def _base_slug(page: PageContent) -> str:
 def _build_slug(page: PageContent) -> str:
     base = _base_slug(page)
 
-    hash_suffix = hashlib.sha256(page.url.encode("utf-8")).hexdigest()[:_HASH_LENGTH]
+    hash_suffix = hashlib.blake2b(
+        page.url.encode("utf-8"), digest_size=_HASH_LENGTH // 2
+    ).hexdigest()
     max_base_length = _MAX_SLUG_LENGTH - _HASH_LENGTH - 1
 
     trimmed_base = base[:max_base_length].rstrip("-")
@@ -47,15 +58,23 @@ def _build_slug(page: PageContent) -> str:
     return f"{trimmed_base}-{hash_suffix}"
 
 
-def _write_markdown(path: Path, content: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+def _write_markdown(path: Path, data: bytes) -> None:
+    parent = path.parent
+    if parent not in _CREATED_DIRS:
+        parent.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(parent)
+    try:
+        path.write_bytes(data)
+    except FileNotFoundError:
+        # The directory was removed after it was memoized; recreate it once.
+        parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
 
 
 async def store_markdown(page: PageContent, settings: Settings) -> Path:
     slug = _build_slug(page)
     path = settings.output_dir / f"{slug}.md"
-    await asyncio.to_thread(_write_markdown, path, page.markdown)
+    await asyncio.to_thread(_write_markdown, path, page.markdown.encode("utf-8"))
     return path
 
 
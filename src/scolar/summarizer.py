@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from textwrap import dedent
+from contextlib import nullcontext
+from typing import Final
 
+import orjson
 from openai import AsyncOpenAI
+from openai.types.responses import EasyInputMessageParam, ResponseInputParam
 
 from .config import Settings
 from .models import (
@@ -23,6 +25,37 @@ SYSTEM_PROMPT = (
     "for the provided research prompt. Respond in compact JSON only."
 )
 
+# Shared by every request; the SDK serialises input without mutating it.
+_SYSTEM_MESSAGE: Final[EasyInputMessageParam] = {
+    "role": "system",
+    "content": SYSTEM_PROMPT,
+}
+
+_USER_PROMPT_TEMPLATE = """\
+Research prompt:
+{research_prompt}
+
+Page title: {title}
+Page URL: {url}
+Page content (Markdown only){truncated_marker}:
+---
+{markdown}
+---
+
+Outbound links (first {link_count}):
+{links_json}
+
+Respond strictly as JSON with:
+{{
+  "summary": <80-120 word neutral summary>,
+  "technical_depth": {{"rating": 1-5, "justification": <text>}},
+  "prompt_fit": {{"rating": 1-5, "justification": <text>}},
+  "recommended_links": [
+    {{"title": <text>, "url": <absolute url>, "reason": <text>}}
+  ]
+}}
+Limit recommended_links to at most {max_recommended_links} items that advance the research."""
+
 
 def _links_payload(page: PageContent, limit: int) -> list[dict[str, str]]:
     payload: list[dict[str, str]] = []
@@ -40,53 +73,28 @@ async def assess_page(
     semaphore: asyncio.Semaphore | None = None,
 ) -> PageAssessment | None:
     links_payload = _links_payload(page, settings.max_links_inspected)
-    prompt = dedent(
-        f"""
-        Research prompt:
-        {research_prompt}
-
-        Page title: {page.title}
-        Page URL: {page.url}
-        Page content (Markdown only){" [TRUNCATED]" if page.truncated else ""}:
-        ---
-        {page.markdown}
-        ---
-
-        Outbound links (first {len(links_payload)}):
-        {json.dumps(links_payload, ensure_ascii=False)}
-
-        Respond strictly as JSON with:
-        {{
-          "summary": <80-120 word neutral summary>,
-          "technical_depth": {{"rating": 1-5, "justification": <text>}},
-          "prompt_fit": {{"rating": 1-5, "justification": <text>}},
-          "recommended_links": [
-            {{"title": <text>, "url": <absolute url>, "reason": <text>}}
-          ]
-        }}
-        Limit recommended_links to at most {settings.max_recommended_links} items that advance the research.
-        """
-    ).strip()
+    prompt = _USER_PROMPT_TEMPLATE.format(
+        research_prompt=research_prompt,
+        title=page.title,
+        url=page.url,
+        truncated_marker=" [TRUNCATED]" if page.truncated else "",
+        markdown=page.markdown,
+        link_count=len(links_payload),
+        links_json=orjson.dumps(links_payload).decode(),
+        max_recommended_links=settings.max_recommended_links,
+    )
+
+    messages: ResponseInputParam = [
+        _SYSTEM_MESSAGE,
+        {"role": "user", "content": prompt},
+    ]
 
     try:
-        if semaphore:
-            async with semaphore:
-                response = await client.responses.create(
-                    model=settings.openai_model,
-                    temperature=settings.openai_temperature,
-                    input=[
-                        {"role": "system", "content": SYSTEM_PROMPT},
-                        {"role": "user", "content": prompt},
-                    ],
-                )
-        else:
+        async with semaphore or nullcontext():
             response = await client.responses.create(
                 model=settings.openai_model,
                 temperature=settings.openai_temperature,
-                input=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
+                input=messages,
             )
     except Exception as exc:  # noqa: BLE001
         logger.error("OpenAI request failed for %s: %s", page.url, exc)
@@ -108,10 +116,9 @@ async def assess_page(
         return None
 
     assessment = payload_to_assessment(payload)
-    if settings.max_recommended_links >= 0:
-        assessment.recommended_links = assessment.recommended_links[
-            : settings.max_recommended_links
-        ]
+    limit = settings.max_recommended_links
+    if 0 <= limit < len(assessment.recommended_links):
+        del assessment.recommended_links[limit:]
     return assessment
 
 
@@ -10,25 +10,15 @@ from .fetcher import RedditComment, RedditThread
 def clean_html_content(html: str) -> str:
     if not html:
         return ""
-    soup = BeautifulSoup(html, "html.parser")
+    if "<" not in html:
+        # No markup to strip. The soup path decodes entities once while parsing
+        # and once more below, so decode twice here to match it.
+        return " ".join(unescape(unescape(html)).split())
+    soup = BeautifulSoup(html, "lxml")
     text = soup.get_text(" ", strip=True)
     return " ".join(unescape(text).split())
 
 
-def _append_comment_paths(
-    lines: list[str],
-    comment: RedditComment,
-    path: str,
-) -> None:
-    author = comment.author or "Anonymous"
-    body = clean_html_content(comment.body_html)
-    lines.append(f"[{path}] {author}: {body}")
-
-    for index, child in enumerate(comment.children, start=1):
-        child_path = f"{path}.{index}"
-        _append_comment_paths(lines, child, child_path)
-
-
 def convert_to_thread_path(thread: RedditThread) -> list[str]:
     lines: list[str] = []
     op_author = thread.author or "Anonymous"
@@ -41,8 +31,21 @@ def convert_to_thread_path(thread: RedditThread) -> list[str]:
 
     lines.append(f"[1] {op_author}: {op_content}")
 
-    for index, comment in enumerate(thread.comments, start=1):
-        _append_comment_paths(lines, comment, f"1.{index}")
+    # Walk the reply tree depth-first with an explicit stack so very deep
+    # threads cannot exhaust the recursion limit.
+    stack: list[tuple[RedditComment, str]] = [
+        (comment, f"1.{index}")
+        for index, comment in reversed(list(enumerate(thread.comments, start=1)))
+    ]
+    append = lines.append
+    while stack:
+        comment, path = stack.pop()
+        author = comment.author or "Anonymous"
+        append(f"[{path}] {author}: {clean_html_content(comment.body_html)}")
+        stack.extend(
+            (child, f"{path}.{index}")
+            for index, child in reversed(list(enumerate(comment.children, start=1)))
+        )
 
     return lines
 
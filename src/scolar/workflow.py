@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import Protocol, runtime_checkable
+from typing import Protocol
 
 import httpx
 from llama_index.core.workflow import Event, StartEvent, StopEvent, Workflow, step
 from llama_index.utils.workflow import draw_all_possible_flows
 from openai import AsyncOpenAI
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from .answer import SynthesisResult
 from .config import Settings
@@ -30,7 +30,30 @@ class ResearchResult:
     errors: list[str] = field(default_factory=list)
 
 
-@runtime_checkable
+def _fail(
+    message: str,
+    *,
+    exit_code: int,
+    prompt: str,
+    urls: list[str],
+    search_plan: SearchExpansion | None,
+) -> StopEvent:
+    """Log ``message`` and stop the workflow with a failed result."""
+
+    logger.error(message)
+    return StopEvent(
+        result=ResearchResult(
+            prompt=prompt,
+            urls=urls,
+            search_plan=search_plan,
+            processed_pages=[],
+            synthesis=None,
+            exit_code=exit_code,
+            errors=[message],
+        )
+    )
+
+
 class GenerateSearchQueriesFn(Protocol):
     async def __call__(
         self,
@@ -40,7 +63,6 @@ class GenerateSearchQueriesFn(Protocol):
     ) -> SearchExpansion | None: ...
 
 
-@runtime_checkable
 class GatherPagesFn(Protocol):
     async def __call__(
         self,
@@ -54,7 +76,6 @@ class GatherPagesFn(Protocol):
     ) -> list[ProcessedPage]: ...
 
 
-@runtime_checkable
 class DiscoverCandidateUrlsFn(Protocol):
     async def __call__(
         self,
@@ -67,7 +88,6 @@ class DiscoverCandidateUrlsFn(Protocol):
     ) -> list[str]: ...
 
 
-@runtime_checkable
 class SynthesizeAnswerFn(Protocol):
     async def __call__(
         self,
@@ -75,10 +95,14 @@ class SynthesizeAnswerFn(Protocol):
         settings: Settings,
         research_prompt: str,
         pages: list[ProcessedPage],
+        *,
+        refresh_cache: bool = False,
     ) -> SynthesisResult | None: ...
 
 
 class ResearchStartEvent(StartEvent):
+    model_config = ConfigDict(frozen=True)
+
     prompt: str
     urls: list[str] = Field(default_factory=list)
     suggest_queries: bool = False
@@ -86,6 +110,8 @@ class ResearchStartEvent(StartEvent):
 
 
 class ResearchPreparedEvent(Event):
+    model_config = ConfigDict(frozen=True)
+
     prompt: str
     urls: list[str] = Field(default_factory=list)
     search_plan: SearchExpansion | None = None
@@ -93,6 +119,8 @@ class ResearchPreparedEvent(Event):
 
 
 class CandidateUrlsEvent(Event):
+    model_config = ConfigDict(frozen=True)
+
     prompt: str
     urls: list[str] = Field(default_factory=list)
     search_plan: SearchExpansion | None = None
@@ -100,10 +128,13 @@ class CandidateUrlsEvent(Event):
 
 
 class PagesReadyEvent(Event):
+    model_config = ConfigDict(frozen=True)
+
     prompt: str
     urls: list[str] = Field(default_factory=list)
     search_plan: SearchExpansion | None = None
     results: list[ProcessedPage] = Field(default_factory=list)
+    refresh_cache: bool = False
 
 
 class ResearchWorkflow(Workflow):
@@ -131,7 +162,7 @@ class ResearchWorkflow(Workflow):
     async def start(
         self, event: ResearchStartEvent
     ) -> ResearchPreparedEvent | StopEvent:
-        urls = list(event.urls)
+        urls = event.urls
         logger.info(
             "Workflow[start]: prompt=%r urls=%d suggest_queries=%s refresh_cache=%s",
             event.prompt,
@@ -188,18 +219,13 @@ class ResearchWorkflow(Workflow):
         )
 
         if not urls:
-            message = "No candidate URLs discovered for the provided prompt"
-            logger.error(message)
-            result = ResearchResult(
+            return _fail(
+                "No candidate URLs discovered for the provided prompt",
+                exit_code=3,
                 prompt=event.prompt,
                 urls=[],
                 search_plan=event.search_plan,
-                processed_pages=[],
-                synthesis=None,
-                exit_code=3,
-                errors=[message],
             )
-            return StopEvent(result=result)
 
         logger.info("Workflow[discover]: discovered %d candidate urls", len(urls))
 
@@ -227,18 +253,13 @@ class ResearchWorkflow(Workflow):
             refresh_cache=event.refresh_cache,
         )
         if not results:
-            message = "No pages processed successfully"
-            logger.error(message)
-            result = ResearchResult(
+            return _fail(
+                "No pages processed successfully",
+                exit_code=1,
                 prompt=event.prompt,
                 urls=event.urls,
                 search_plan=event.search_plan,
-                processed_pages=[],
-                synthesis=None,
-                exit_code=1,
-                errors=[message],
             )
-            return StopEvent(result=result)
 
         logger.info(
             "Workflow[gather]: processed %d/%d urls",
@@ -251,6 +272,7 @@ class ResearchWorkflow(Workflow):
             urls=event.urls,
             search_plan=event.search_plan,
             results=results,
+            refresh_cache=event.refresh_cache,
         )
 
     @step(num_workers=1)
@@ -265,6 +287,7 @@ class ResearchWorkflow(Workflow):
             self._settings,
             event.prompt,
             event.results,
+            refresh_cache=event.refresh_cache,
         )
         logger.info(
             "Workflow[synthesize]: synthesis=%s",
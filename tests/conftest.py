@@ -0,0 +1,43 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from scolar.config import Settings
+
+
+@pytest.fixture(scope="session")
+def base_settings() -> Settings:
+    """Deterministic settings validated once per session.
+
+    Tests derive their own copy with ``model_copy(update=...)``, typically to
+    point ``output_dir`` at ``tmp_path``.
+    """
+
+    return Settings(
+        fetch_concurrency=2,
+        request_timeout=10.0,
+        request_retries=0,
+        request_backoff=0.0,
+        user_agent="TestAgent",
+        max_markdown_chars=10_000,
+        max_links_inspected=10,
+        max_recommended_links=3,
+        openai_model="mock-model",
+        openai_temperature=0.0,
+        openai_timeout=10.0,
+        llm_concurrency=2,
+        final_answer_max_pages=5,
+        final_answer_excerpt_chars=1_500,
+        cache_ttl_hours=72,
+    )
+
+
+@pytest.fixture
+def settings(base_settings: Settings, tmp_path: Path) -> Settings:
+    """``base_settings`` writing its artifacts under the test's ``tmp_path``."""
+
+    return base_settings.model_copy(update={"output_dir": tmp_path})
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from pathlib import Path
 from typing import cast
 
 import pytest
@@ -16,11 +15,36 @@ from scolar.models import LinkInfo, PageAssessment, PageContent, RecommendedLink
 from scolar.pipeline import ProcessedPage
 
 
-@dataclass
+@dataclass(slots=True)
 class _FakeLLMResponse:
     output_text: str
 
 
+@dataclass(slots=True)
+class _FakeStreamEvent:
+    type: str
+    delta: str = ""
+
+
+class _FakeStream:
+    def __init__(self, chunks: list[str]) -> None:
+        self._chunks = chunks
+
+    async def __aenter__(self) -> _FakeStream:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+    async def __aiter__(self):  # noqa: ANN204
+        for chunk in self._chunks:
+            yield _FakeStreamEvent(type="response.output_text.delta", delta=chunk)
+        yield _FakeStreamEvent(type="response.completed")
+
+    async def get_final_response(self) -> _FakeLLMResponse:
+        return _FakeLLMResponse(output_text="".join(self._chunks))
+
+
 class _FakeResponses:
     def __init__(self, payload: str) -> None:
         self.payload = payload
@@ -30,32 +54,30 @@ class _FakeResponses:
         self.calls.append(kwargs)
         return _FakeLLMResponse(output_text=self.payload)
 
+    def stream(self, **kwargs) -> _FakeStream:  # noqa: ANN003
+        self.calls.append(kwargs)
+        chunks = [self.payload[i : i + 4] for i in range(0, len(self.payload), 4)]
+        return _FakeStream(chunks)
+
 
 class _FakeLLMClient:
     def __init__(self, payload: str) -> None:
         self.responses = _FakeResponses(payload)
 
 
-def _settings(
-    tmp_path: Path, *, max_pages: int = 2, excerpt_chars: int = 240
-) -> Settings:
-    return Settings(
-        fetch_concurrency=2,
-        request_timeout=10.0,
-        request_retries=0,
-        request_backoff=0.0,
-        user_agent="TestAgent",
-        output_dir=tmp_path,
-        max_markdown_chars=1_000,
-        max_links_inspected=5,
-        max_recommended_links=2,
-        openai_model="mock-model",
-        openai_temperature=0.0,
-        openai_timeout=10.0,
-        llm_concurrency=1,
-        final_answer_max_pages=max_pages,
-        final_answer_excerpt_chars=excerpt_chars,
-        cache_ttl_hours=72,
+@pytest.fixture
+def answer_settings(settings: Settings) -> Settings:
+    """Shared test settings with a small synthesis budget."""
+
+    return settings.model_copy(
+        update={
+            "max_markdown_chars": 1_000,
+            "max_links_inspected": 5,
+            "max_recommended_links": 2,
+            "llm_concurrency": 1,
+            "final_answer_max_pages": 2,
+            "final_answer_excerpt_chars": 240,
+        }
     )
 
 
@@ -88,7 +110,9 @@ def _page(
 
 
 @pytest.mark.asyncio
-async def test_synthesize_answer_orders_and_limits_pages(tmp_path: Path) -> None:
+async def test_synthesize_answer_orders_and_limits_pages(
+    answer_settings: Settings,
+) -> None:
     """Top pages should be ordered by prompt fit then technical depth and passed to the LLM."""
 
     page_low = _page(
@@ -128,11 +152,10 @@ async def test_synthesize_answer_orders_and_limits_pages(tmp_path: Path) -> None
     client = _FakeLLMClient(
         "## Answer\nReady\n\n## Evidence\n- (Page 1)\n\n## Remaining Gaps\nNone"
     )
-    settings = _settings(tmp_path, max_pages=2, excerpt_chars=240)
 
     result = await synthesize_answer(
         cast(AsyncOpenAI, client),
-        settings,
+        answer_settings,
         research_prompt="Prompt",
         pages=[page_low, page_mid, page_high],
     )
@@ -143,14 +166,17 @@ async def test_synthesize_answer_orders_and_limits_pages(tmp_path: Path) -> None
 
     call = client.responses.calls[0]
     user_message = call["input"][1]["content"]
-    assert "Page 1: High" in user_message
+    assert user_message.startswith("Research prompt:\nPrompt\n")
+    assert "\nPage 1: High\nURL: https://example.com/high\n" in user_message
     assert "Page 2: Mid" in user_message
     assert "...[truncated]..." in user_message
     assert "Low" not in user_message
 
 
 @pytest.mark.asyncio
-async def test_synthesize_answer_returns_none_on_empty_payload(tmp_path: Path) -> None:
+async def test_synthesize_answer_returns_none_on_empty_payload(
+    answer_settings: Settings,
+) -> None:
     """If the LLM returns an empty payload the synthesis result should be None."""
 
     page = _page(
@@ -168,11 +194,10 @@ async def test_synthesize_answer_returns_none_on_empty_payload(tmp_path: Path) -
             super().__init__(payload=" ")
 
     client = _EmptyClient()
-    settings = _settings(tmp_path)
 
     result = await synthesize_answer(
         cast(AsyncOpenAI, client),
-        settings,
+        answer_settings,
         research_prompt="Prompt",
         pages=[page],
     )
@@ -181,18 +206,152 @@ async def test_synthesize_answer_returns_none_on_empty_payload(tmp_path: Path) -
 
 
 @pytest.mark.asyncio
-async def test_synthesize_answer_handles_no_pages(tmp_path: Path) -> None:
+async def test_synthesize_answer_handles_no_pages(answer_settings: Settings) -> None:
     """Requesting synthesis without pages should short-circuit gracefully."""
 
     client = _FakeLLMClient("irrelevant")
-    settings = _settings(tmp_path)
 
     result = await synthesize_answer(
         cast(AsyncOpenAI, client),
-        settings,
+        answer_settings,
         research_prompt="Prompt",
         pages=[],
     )
 
     assert result is None
     assert client.responses.calls == []
+
+
+@pytest.mark.asyncio
+async def test_synthesize_answer_streams_tokens_to_callback(
+    answer_settings: Settings,
+) -> None:
+    """Streaming synthesis should forward each delta and return the full answer."""
+
+    page = _page(
+        url="https://example.com",
+        title="Example",
+        markdown="Content",
+        prompt_fit=4,
+        prompt_fit_reason="Relevant",
+        technical_depth=3,
+        technical_reason="Detailed",
+    )
+    client = _FakeLLMClient("## Answer Streamed")
+    received: list[str] = []
+
+    async def on_token(token: str) -> None:
+        received.append(token)
+
+    result = await synthesize_answer(
+        cast(AsyncOpenAI, client),
+        answer_settings,
+        research_prompt="Prompt",
+        pages=[page],
+        on_token=on_token,
+    )
+
+    assert len(received) > 1
+    assert "".join(received) == "## Answer Streamed"
+    assert result is not None
+    assert result.answer == "## Answer Streamed"
+
+
+@pytest.mark.asyncio
+async def test_synthesize_answer_reuses_cached_answer(
+    answer_settings: Settings,
+) -> None:
+    """Repeating an identical request should be served from the answer cache."""
+
+    page = _page(
+        url="https://example.com",
+        title="Example",
+        markdown="Content",
+        prompt_fit=4,
+        prompt_fit_reason="Relevant",
+        technical_depth=3,
+        technical_reason="Detailed",
+    )
+    client = _FakeLLMClient("## Answer\nCached")
+
+    for _ in range(2):
+        result = await synthesize_answer(
+            cast(AsyncOpenAI, client),
+            answer_settings,
+            research_prompt="Prompt",
+            pages=[page],
+        )
+        assert result is not None
+        assert result.answer == "## Answer\nCached"
+
+    assert len(client.responses.calls) == 1
+
+    await synthesize_answer(
+        cast(AsyncOpenAI, client),
+        answer_settings,
+        research_prompt="Prompt",
+        pages=[page],
+        refresh_cache=True,
+    )
+
+    assert len(client.responses.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_synthesize_answer_survives_cache_write_failure(
+    answer_settings: Settings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed answer-cache write should not discard the synthesized answer."""
+
+    async def failing_save(*_args: object, **_kwargs: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr("scolar.answer.AnswerCache.save", failing_save)
+    page = _page(
+        url="https://example.com",
+        title="Example",
+        markdown="Content",
+        prompt_fit=4,
+        prompt_fit_reason="Relevant",
+        technical_depth=3,
+        technical_reason="Detailed",
+    )
+
+    result = await synthesize_answer(
+        cast(AsyncOpenAI, _FakeLLMClient("## Answer\nKept")),
+        answer_settings,
+        research_prompt="Prompt",
+        pages=[page],
+    )
+
+    assert result is not None
+    assert result.answer == "## Answer\nKept"
+
+
+@pytest.mark.asyncio
+async def test_synthesize_answer_propagates_token_callback_errors(
+    answer_settings: Settings,
+) -> None:
+    """Errors raised by the caller's callback should not be reported as API failures."""
+
+    async def on_token(_delta: str) -> None:
+        raise RuntimeError("display closed")
+
+    page = _page(
+        url="https://example.com",
+        title="Example",
+        markdown="Content",
+        prompt_fit=4,
+        prompt_fit_reason="Relevant",
+        technical_depth=3,
+        technical_reason="Detailed",
+    )
+
+    with pytest.raises(RuntimeError, match="display closed"):
+        await synthesize_answer(
+            cast(AsyncOpenAI, _FakeLLMClient("## Answer\nStreamed")),
+            answer_settings,
+            research_prompt="Prompt",
+            pages=[page],
+            on_token=on_token,
+        )
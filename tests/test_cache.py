@@ -0,0 +1,125 @@
+"""Tests for the on-disk page cache helpers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import orjson
+import pytest
+
+from scolar.cache import (
+    PageCache,
+    cache_key_digest,
+    parse_cache_timestamp,
+    read_cache_file,
+    write_cache_file,
+)
+from scolar.config import Settings
+from scolar.models import (
+    LinkInfo,
+    PageAssessment,
+    PageContent,
+    RecommendedLink,
+    Score,
+)
+
+
+def test_read_cache_file_returns_none_for_missing_entry(tmp_path: Path) -> None:
+    """Missing cache entries should read as None instead of raising."""
+
+    assert read_cache_file(tmp_path / "missing.json") is None
+
+
+def test_write_cache_file_replaces_entry_without_leftovers(tmp_path: Path) -> None:
+    """Atomic writes should overwrite the entry and clean up temporary files."""
+
+    path = tmp_path / "entry.json"
+    write_cache_file(path, b'{"value": 1}')
+    write_cache_file(path, b'{"value": 2}')
+
+    assert read_cache_file(path) == b'{"value": 2}'
+    assert [item.name for item in tmp_path.iterdir()] == ["entry.json"]
+
+
+def test_cache_key_digest_is_stable_and_distinct() -> None:
+    """Digests should be deterministic per key and differ between keys."""
+
+    first = cache_key_digest("https://example.com/a")
+
+    assert cache_key_digest("https://example.com/a") == first
+    assert cache_key_digest("https://example.com/b") != first
+    assert len(first) == 32
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("2026-10-15T12:00:00+00:00", datetime(2026, 10, 15, 12, tzinfo=timezone.utc)),
+        ("2026-10-15T12:00:00", datetime(2026, 10, 15, 12, tzinfo=timezone.utc)),
+        ("not-a-timestamp", None),
+        (None, None),
+    ],
+)
+def test_parse_cache_timestamp(raw: object, expected: datetime | None) -> None:
+    """Timestamps should parse as aware UTC datetimes and reject malformed input."""
+
+    assert parse_cache_timestamp(raw) == expected
+
+
+@pytest.mark.asyncio
+async def test_page_cache_round_trips_through_disk(settings: Settings) -> None:
+    """Entries should persist relative markdown paths and restore them on load."""
+
+    url = "https://example.com/round-trip"
+    page = PageContent(
+        url=url,
+        title="Title",
+        markdown="Body",
+        links=[LinkInfo(title="Next", url="https://example.com/next")],
+        truncated=True,
+        markdown_path=settings.output_dir / "pages" / "title.md",
+    )
+    assessment = PageAssessment(
+        summary="Summary",
+        technical_depth=Score(rating=3, justification="Depth"),
+        prompt_fit=Score(rating=4, justification="Fit"),
+        recommended_links=[
+            RecommendedLink(title="More", url="https://example.com/more", reason="R")
+        ],
+    )
+
+    await PageCache(settings).save(url=url, page=page, assessment=assessment)
+    (entry,) = (settings.output_dir / "_cache").glob("*.json")
+    stored = orjson.loads(entry.read_bytes())
+    cached = await PageCache(settings).load(url)
+
+    assert stored["page"]["markdown_path"] == str(Path("pages") / "title.md")
+    assert cached is not None
+    assert cached.page == page
+    assert cached.assessment == assessment
+
+
+@pytest.mark.asyncio
+async def test_page_cache_load_many_reports_hits_and_misses(settings: Settings) -> None:
+    """Batch loads should return every requested URL, mapping misses to None."""
+
+    hit_url = "https://example.com/hit"
+    page = PageContent(
+        url=hit_url, title="Hit", markdown="Body", links=[], truncated=False
+    )
+    assessment = PageAssessment(
+        summary="Summary",
+        technical_depth=Score(rating=3, justification="Depth"),
+        prompt_fit=Score(rating=4, justification="Fit"),
+        recommended_links=[],
+    )
+    await PageCache(settings).save(url=hit_url, page=page, assessment=assessment)
+
+    loaded = await PageCache(settings).load_many(["https://example.com/miss", hit_url])
+
+    assert list(loaded) == ["https://example.com/miss", hit_url]
+    assert loaded["https://example.com/miss"] is None
+    hit = loaded[hit_url]
+    assert hit is not None
+    assert hit.page.title == "Hit"
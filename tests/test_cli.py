@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
 from scolar.answer import SynthesisResult
 from scolar.config import Settings
-from scolar.main import run_async, run_visualize
+from scolar.main import _read_urls, run_async, run_visualize
 from scolar.models import (
     LinkInfo,
     PageAssessment,
@@ -21,10 +23,29 @@ from scolar.models import (
 from scolar.pipeline import ProcessedPage
 from scolar.search import SearchExpansion
 
+_RESEARCH_ARGS: dict[str, object] = {
+    "command": "research",
+    "prompt": "",
+    "urls": (),
+    "urls_file": None,
+    "output_dir": None,
+    "json_output": None,
+    "verbose": False,
+    "refresh_cache": False,
+    "suggest_queries": False,
+}
+
+_REPORT_OUTPUT_RE = re.compile(
+    r"Final synthesized answer[\s\S]*?Example Page[\s\S]*?Summary text"
+)
+_DISCOVERY_OUTPUT_RE = re.compile(
+    r"Suggested Search Queries[\s\S]*?ai safety regulation timeline"
+    r"[\s\S]*?Reddit Discussion"
+)
+
 
 class _DummyAsyncClient:
-    def __init__(self, *args, **kwargs):  # noqa: D401, ANN002
-        pass
+    __slots__ = ()
 
     async def __aenter__(self):
         return self
@@ -38,37 +59,43 @@ class _DummyLLMClient:
         return None
 
 
+def _patch_main(monkeypatch: pytest.MonkeyPatch, **attributes: object) -> None:
+    """Replace several ``scolar.main`` attributes in one call."""
+
+    for name, value in attributes.items():
+        monkeypatch.setattr(f"scolar.main.{name}", value)
+
+
+@pytest.fixture(scope="module")
+def dummy_llm() -> Iterator[_DummyLLMClient]:
+    """Stub out the HTTP and OpenAI clients that ``run_async`` constructs.
+
+    The patch is applied once per module; it patches ``httpx`` itself, so it
+    must not outlive the CLI tests.
+    """
+
+    http_client = _DummyAsyncClient()
+    client = _DummyLLMClient()
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(
+            "scolar.main.httpx.AsyncClient", lambda *args, **kwargs: http_client
+        )
+        patcher.setattr("scolar.main.AsyncOpenAI", lambda timeout: client)
+        yield client
+
+
 @pytest.mark.asyncio
 async def test_run_async_outputs_markdown_and_json(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    base_settings: Settings,
+    dummy_llm: _DummyLLMClient,
 ) -> None:
     """The CLI should print markdown and write JSON when requested."""
 
     output_dir = tmp_path / "artifacts"
-    settings = Settings(
-        fetch_concurrency=2,
-        request_timeout=10.0,
-        request_retries=0,
-        request_backoff=0.0,
-        user_agent="TestAgent",
-        output_dir=output_dir,
-        max_markdown_chars=1000,
-        max_links_inspected=10,
-        max_recommended_links=3,
-        openai_model="mock-model",
-        openai_temperature=0.0,
-        openai_timeout=10.0,
-        llm_concurrency=1,
-        final_answer_max_pages=5,
-        final_answer_excerpt_chars=1_500,
-        cache_ttl_hours=72,
-    )
-
-    monkeypatch.setattr("scolar.main.load_settings", lambda: settings)
-    monkeypatch.setattr("scolar.main.httpx.AsyncClient", _DummyAsyncClient)
-
-    dummy_llm = _DummyLLMClient()
-    monkeypatch.setattr("scolar.main.AsyncOpenAI", lambda timeout: dummy_llm)
+    settings = base_settings.model_copy(update={"output_dir": output_dir})
 
     page = PageContent(
         url="https://example.com",
@@ -76,11 +103,8 @@ async def test_run_async_outputs_markdown_and_json(
         markdown="Content",
         links=[LinkInfo(title="More", url="https://example.com/more")],
         truncated=False,
+        markdown_path=output_dir / "example-page.md",
     )
-    markdown_path = output_dir / "example-page.md"
-    markdown_path.parent.mkdir(parents=True, exist_ok=True)
-    markdown_path.write_text("Content", encoding="utf-8")
-    page.markdown_path = markdown_path
 
     assessment = PageAssessment(
         summary="Summary text",
@@ -103,9 +127,10 @@ async def test_run_async_outputs_markdown_and_json(
         assert refresh_cache is False
         return [processed]
 
-    monkeypatch.setattr("scolar.main.gather_pages", fake_gather_pages)
-
-    async def fake_synthesize_answer(llm_client, settings, research_prompt, pages):  # noqa: ANN001, ANN202
+    async def fake_synthesize_answer(
+        llm_client, settings, research_prompt, pages, *, refresh_cache
+    ):  # noqa: ANN001, ANN202
+        assert refresh_cache is False
         assert llm_client is dummy_llm
         assert research_prompt == "Test prompt"
         assert pages == [processed]
@@ -113,36 +138,36 @@ async def test_run_async_outputs_markdown_and_json(
             answer="Final synthesized answer", ordered_pages=[processed]
         )
 
-    monkeypatch.setattr("scolar.main.synthesize_answer", fake_synthesize_answer)
-
     async def fail_discover(**_kwargs):  # noqa: ANN003, ANN202
         raise AssertionError(
             "discover_candidate_urls should not be invoked when URLs are provided"
         )
 
-    monkeypatch.setattr("scolar.main.discover_candidate_urls", fail_discover)
+    _patch_main(
+        monkeypatch,
+        load_settings=lambda: settings,
+        gather_pages=fake_gather_pages,
+        synthesize_answer=fake_synthesize_answer,
+        discover_candidate_urls=fail_discover,
+    )
 
     json_path = tmp_path / "report.json"
     args = argparse.Namespace(
-        prompt="Test prompt",
-        urls=["https://example.com"],
-        urls_file=None,
-        output_dir=None,
-        json_output=json_path,
-        verbose=False,
-        refresh_cache=False,
-        suggest_queries=False,
+        **_RESEARCH_ARGS
+        | {
+            "prompt": "Test prompt",
+            "urls": ["https://example.com"],
+            "json_output": json_path,
+        }
     )
 
     exit_code = await run_async(args)
     assert exit_code == 0
 
     output = capsys.readouterr().out
-    assert "Final synthesized answer" in output
-    assert "Example Page" in output
-    assert "Summary text" in output
+    assert _REPORT_OUTPUT_RE.search(output)
 
-    data = json.loads(json_path.read_text(encoding="utf-8"))
+    data = json.loads(json_path.read_bytes())
     assert data["prompt"] == "Test prompt"
     assert data["pages"][0]["title"] == "Example Page"
     assert (
@@ -155,16 +180,14 @@ async def test_run_async_outputs_markdown_and_json(
 
 @pytest.mark.asyncio
 async def test_run_async_discovers_urls_when_missing(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    base_settings: Settings,
+    dummy_llm: _DummyLLMClient,
 ) -> None:
     output_dir = tmp_path / "artifacts"
-    settings = Settings(output_dir=output_dir)
-
-    monkeypatch.setattr("scolar.main.load_settings", lambda: settings)
-    monkeypatch.setattr("scolar.main.httpx.AsyncClient", _DummyAsyncClient)
-
-    dummy_llm = _DummyLLMClient()
-    monkeypatch.setattr("scolar.main.AsyncOpenAI", lambda timeout: dummy_llm)
+    settings = base_settings.model_copy(update={"output_dir": output_dir})
 
     plan = SearchExpansion(
         primary_query="ai safety policy timeline",
@@ -179,8 +202,6 @@ async def test_run_async_discovers_urls_when_missing(
         assert llm_client is dummy_llm
         return plan
 
-    monkeypatch.setattr("scolar.main.generate_search_queries", fake_generate)
-
     discovered_urls = [
         "https://www.reddit.com/r/localllama/comments/abc123/example_discussion/"
     ]
@@ -194,19 +215,14 @@ async def test_run_async_discovers_urls_when_missing(
         discover_called["value"] = True
         return discovered_urls
 
-    monkeypatch.setattr("scolar.main.discover_candidate_urls", fake_discover)
-
     page = PageContent(
         url=discovered_urls[0],
         title="Reddit Discussion",
         markdown="Thread content",
         links=[],
         truncated=False,
+        markdown_path=output_dir / "reddit-discussion.md",
     )
-    markdown_path = output_dir / "reddit-discussion.md"
-    markdown_path.parent.mkdir(parents=True, exist_ok=True)
-    markdown_path.write_text("Thread content", encoding="utf-8")
-    page.markdown_path = markdown_path
 
     assessment = PageAssessment(
         summary="Thread summary",
@@ -226,27 +242,28 @@ async def test_run_async_discovers_urls_when_missing(
         assert refresh_cache is False
         return [processed]
 
-    monkeypatch.setattr("scolar.main.gather_pages", fake_gather_pages)
-
-    async def fake_synthesize_answer(llm_client, settings, research_prompt, pages):  # noqa: ANN001, ANN202
+    async def fake_synthesize_answer(
+        llm_client, settings, research_prompt, pages, *, refresh_cache
+    ):  # noqa: ANN001, ANN202
+        assert refresh_cache is False
         assert llm_client is dummy_llm
         assert research_prompt == "AI safety"
         assert pages == [processed]
         return None
 
-    monkeypatch.setattr("scolar.main.synthesize_answer", fake_synthesize_answer)
+    _patch_main(
+        monkeypatch,
+        load_settings=lambda: settings,
+        generate_search_queries=fake_generate,
+        discover_candidate_urls=fake_discover,
+        gather_pages=fake_gather_pages,
+        synthesize_answer=fake_synthesize_answer,
+    )
 
     json_path = tmp_path / "queries.json"
     args = argparse.Namespace(
-        command="research",
-        prompt="AI safety",
-        urls=[],
-        urls_file=None,
-        output_dir=None,
-        json_output=json_path,
-        verbose=False,
-        refresh_cache=False,
-        suggest_queries=True,
+        **_RESEARCH_ARGS
+        | {"prompt": "AI safety", "json_output": json_path, "suggest_queries": True}
     )
 
     exit_code = await run_async(args)
@@ -254,11 +271,9 @@ async def test_run_async_discovers_urls_when_missing(
     assert discover_called["value"] is True
 
     output = capsys.readouterr().out
-    assert "Suggested Search Queries" in output
-    assert "ai safety regulation timeline" in output
-    assert "Reddit Discussion" in output
+    assert _DISCOVERY_OUTPUT_RE.search(output)
 
-    data = json.loads(json_path.read_text(encoding="utf-8"))
+    data = json.loads(json_path.read_bytes())
     assert data["search_queries"]["primary_query"] == plan.primary_query
     assert data["pages"][0]["url"] == discovered_urls[0]
     assert data["final_answer"] is None
@@ -268,8 +283,6 @@ def test_run_visualize_writes_diagram(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     settings = Settings()
-    monkeypatch.setattr("scolar.main.load_settings", lambda: settings)
-
     recorded = {"called": False}
 
     def fake_visualize(workflow, *, output_path, notebook, max_label_length):  # noqa: ANN001
@@ -279,7 +292,11 @@ def test_run_visualize_writes_diagram(
         (tmp_path / "custom.html").write_text("<html></html>", encoding="utf-8")
         recorded["called"] = True
 
-    monkeypatch.setattr("scolar.main.visualize_research_workflow", fake_visualize)
+    _patch_main(
+        monkeypatch,
+        load_settings=lambda: settings,
+        visualize_research_workflow=fake_visualize,
+    )
 
     args = argparse.Namespace(
         command="visualize-workflow",
@@ -293,3 +310,26 @@ def test_run_visualize_writes_diagram(
     assert exit_code == 0
     assert recorded["called"] is True
     assert (tmp_path / "custom.html").exists()
+
+
+def test_read_urls_merges_file_and_dedupes_in_order(tmp_path: Path) -> None:
+    """CLI and file URLs should merge in order with blank lines and repeats dropped."""
+
+    urls_file = tmp_path / "urls.txt"
+    urls_file.write_text(
+        "https://b.example\n\n  https://a.example  \nhttps://c.example\n",
+        encoding="utf-8",
+    )
+
+    urls = _read_urls(["https://a.example", "https://b.example"], urls_file)
+
+    assert urls == ["https://a.example", "https://b.example", "https://c.example"]
+
+
+def test_read_urls_keeps_each_line_whole(tmp_path: Path) -> None:
+    """Inner whitespace should not split a line into several URLs."""
+
+    urls_file = tmp_path / "urls.txt"
+    urls_file.write_text("https://a.example  # note\n", encoding="utf-8")
+
+    assert _read_urls([], urls_file) == ["https://a.example  # note"]
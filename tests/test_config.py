@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import importlib
 from pathlib import Path
 from textwrap import dedent
 
@@ -74,29 +73,78 @@ def test_load_settings_from_single_file(
     assert settings.cache_ttl_hours == 48
 
 
-def test_environment_overrides_take_precedence(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+_LAYERING_CASES = [
+    pytest.param(
+        {
+            "settings.toml": "[default]\nfetch_concurrency = 3\nopenai_temperature = 0.1\n"
+        },
+        {"SCOLAR_FETCH_CONCURRENCY": "11", "SCOLAR_OPENAI_TEMPERATURE": "0.9"},
+        {"fetch_concurrency": 11, "openai_temperature": 0.9},
+        id="prefixed-environment-overrides-file",
+    ),
+    pytest.param(
+        {
+            "base.toml": '[default]\nfetch_concurrency = 4\nuser_agent = "BaseAgent"\n',
+            "override.toml": "[default]\nfetch_concurrency = 8\n",
+        },
+        {},
+        {"fetch_concurrency": 8, "user_agent": "BaseAgent"},
+        id="later-file-overrides-earlier",
+    ),
+    pytest.param(
+        {"settings.toml": '[default]\noutput_dir = "~/custom/artifacts"\n'},
+        {},
+        {"output_dir": Path("~/custom/artifacts").expanduser()},
+        id="output-dir-expands-user-home",
+    ),
+    pytest.param(
+        {"settings.toml": "[default]\nfetch_concurrency = 5\n"},
+        {"FETCH_CONCURRENCY": "99"},
+        {"fetch_concurrency": 5},
+        id="unprefixed-environment-ignored",
+    ),
+    pytest.param(
+        {
+            "first.toml": '[default]\nfetch_concurrency = 2\nuser_agent = "FirstAgent"\n',
+            "second.toml": "[default]\nfetch_concurrency = 6\n",
+        },
+        {"SCOLAR_FETCH_CONCURRENCY": "12"},
+        {"fetch_concurrency": 12, "user_agent": "FirstAgent"},
+        id="environment-beats-all-files",
+    ),
+    pytest.param(
+        {"alt_config/custom.toml": "[default]\nllm_concurrency = 4\n"},
+        {},
+        {"llm_concurrency": 4},
+        id="custom-file-location",
+    ),
+]
+
+
+@pytest.mark.parametrize(("files", "env", "expected"), _LAYERING_CASES)
+def test_load_settings_layers_files_and_environment(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    files: dict[str, str],
+    env: dict[str, str],
+    expected: dict[str, object],
 ) -> None:
-    """Environment variables with the SCOLAR_ prefix should override TOML values."""
-
-    settings_file = tmp_path / "settings.toml"
-    settings_file.write_text(
-        """
-        [default]
-        fetch_concurrency = 3
-        openai_temperature = 0.1
-        """.strip(),
-        encoding="utf-8",
-    )
-
-    monkeypatch.setenv("SCOLAR_FETCH_CONCURRENCY", "11")
-    monkeypatch.setenv("SCOLAR_OPENAI_TEMPERATURE", "0.9")
-    _patch_dynaconf(monkeypatch, settings_file)
+    """Priority is defaults < earlier files < later files < SCOLAR_ environment."""
+
+    paths: list[Path] = []
+    for name, content in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        paths.append(path)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    _patch_dynaconf(monkeypatch, *paths)
 
     settings = config.load_settings()
 
-    assert settings.fetch_concurrency == 11
-    assert settings.openai_temperature == pytest.approx(0.9)
+    for field_name, expected_value in expected.items():
+        assert getattr(settings, field_name) == expected_value
 
 
 def test_invalid_values_raise_validation_error(
@@ -119,136 +167,14 @@ def test_invalid_values_raise_validation_error(
         config.load_settings()
 
 
-def test_multiple_settings_files_override_order(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Later settings files should override earlier ones while preserving untouched keys."""
-
-    base = tmp_path / "base.toml"
-    override = tmp_path / "override.toml"
-
-    base.write_text(
-        """
-        [default]
-        fetch_concurrency = 4
-        user_agent = "BaseAgent"
-        """.strip(),
-        encoding="utf-8",
-    )
-    override.write_text(
-        """
-        [default]
-        fetch_concurrency = 8
-        """.strip(),
-        encoding="utf-8",
-    )
-
-    _patch_dynaconf(monkeypatch, base, override)
-    settings = config.load_settings()
-
-    assert settings.fetch_concurrency == 8
-    assert settings.user_agent == "BaseAgent"
-
-
-def test_output_dir_expands_user_home(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """The configured output directory should expand user home references."""
-
-    file = tmp_path / "settings.toml"
-    file.write_text(
-        """
-        [default]
-        output_dir = "~/custom/artifacts"
-        """.strip(),
-        encoding="utf-8",
-    )
-
-    _patch_dynaconf(monkeypatch, file)
-    settings = config.load_settings()
-
-    assert settings.output_dir == Path("~/custom/artifacts").expanduser()
-
-
-def test_non_prefixed_environment_variables_are_ignored(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Environment variables without the SCOLAR_ prefix must not override settings."""
-
-    file = tmp_path / "settings.toml"
-    file.write_text(
-        """
-        [default]
-        fetch_concurrency = 5
-        """.strip(),
-        encoding="utf-8",
-    )
-
-    monkeypatch.setenv("FETCH_CONCURRENCY", "99")
-    _patch_dynaconf(monkeypatch, file)
-
-    settings = config.load_settings()
-    assert settings.fetch_concurrency == 5
-
-
-def test_merging_files_and_environment_priority(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Priority order should be defaults < first file < second file < environment variables."""
-
-    first = tmp_path / "first.toml"
-    second = tmp_path / "second.toml"
-
-    first.write_text(
-        """
-        [default]
-        fetch_concurrency = 2
-        user_agent = "FirstAgent"
-        """.strip(),
-        encoding="utf-8",
-    )
-    second.write_text(
-        """
-        [default]
-        fetch_concurrency = 6
-        """.strip(),
-        encoding="utf-8",
-    )
-
-    monkeypatch.setenv("SCOLAR_FETCH_CONCURRENCY", "12")
-    _patch_dynaconf(monkeypatch, first, second)
-
-    settings = config.load_settings()
-
-    assert settings.fetch_concurrency == 12
-    assert settings.user_agent == "FirstAgent"
-
-
-def test_custom_settings_file_location(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Pointing Dynaconf at an alternate settings file should control the resulting configuration."""
-
-    custom_dir = tmp_path / "alt_config"
-    custom_dir.mkdir()
-    custom_file = custom_dir / "custom.toml"
-    custom_file.write_text(
-        """
-        [default]
-        llm_concurrency = 4
-        """.strip(),
-        encoding="utf-8",
-    )
-
-    _patch_dynaconf(monkeypatch, custom_file)
-    settings = config.load_settings()
+def test_settings_are_immutable_after_load() -> None:
+    """Loaded settings are frozen; overrides must go through ``model_copy``."""
 
-    assert settings.llm_concurrency == 4
+    settings = config.Settings()
 
+    with pytest.raises(ValidationError):
+        settings.fetch_concurrency = 9
 
-@pytest.fixture(autouse=True)
-def _restore_config_module():
-    """Reload the config module after each test to reset Dynaconf state."""
-
-    yield
-    importlib.reload(config)
+    updated = settings.model_copy(update={"fetch_concurrency": 9})
+    assert updated.fetch_concurrency == 9
+    assert settings.fetch_concurrency != 9
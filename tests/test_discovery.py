@@ -1,15 +1,29 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from pathlib import Path
 from typing import cast
 
 import httpx
+import orjson
 import pytest
 
 from scolar.config import Settings
 from scolar.discovery import SearchHitCache, discover_candidate_urls
 
+_CACHED_URLS = ("https://www.reddit.com/r/localllama/comments/abc/agent_thread/",)
+_DISCOVERED_URLS = (
+    "https://example.com/discussion",
+    "https://www.reddit.com/r/localllama/comments/xyz/discussion/",
+)
+
+
+@pytest.fixture
+def discovery_env(settings: Settings) -> tuple[Settings, SearchHitCache]:
+    """Settings and a search-hit cache rooted in the test's temporary directory."""
+
+    settings = settings.model_copy(update={"max_links_inspected": 2})
+    return settings, SearchHitCache(settings, ttl=timedelta(days=3))
+
 
 class _FailingClient:
     async def get(self, *_args, **_kwargs):  # noqa: ANN002, ANN003, ANN202
@@ -18,14 +32,11 @@ class _FailingClient:
 
 class _DummyResponse:
     def __init__(self, payload: dict) -> None:
-        self._payload = payload
+        self.content = orjson.dumps(payload)
 
     def raise_for_status(self) -> None:
         return None
 
-    def json(self) -> dict:
-        return self._payload
-
 
 class _RecordingClient:
     def __init__(self, payload: dict) -> None:
@@ -38,12 +49,13 @@ class _RecordingClient:
 
 
 @pytest.mark.asyncio
-async def test_discover_candidate_urls_uses_cache(tmp_path: Path) -> None:
-    settings = Settings(output_dir=tmp_path)
-    cache = SearchHitCache(settings, ttl=timedelta(days=3))
+async def test_discover_candidate_urls_uses_cache(
+    discovery_env: tuple[Settings, SearchHitCache],
+) -> None:
+    settings, cache = discovery_env
     await cache.save(
         prompt="llm agents",
-        urls=["https://www.reddit.com/r/localllama/comments/abc/agent_thread/"],
+        urls=list(_CACHED_URLS),
     )
 
     result = await discover_candidate_urls(
@@ -54,12 +66,14 @@ async def test_discover_candidate_urls_uses_cache(tmp_path: Path) -> None:
         cache=cache,
     )
 
-    assert result == ["https://www.reddit.com/r/localllama/comments/abc/agent_thread/"]
+    assert tuple(result) == _CACHED_URLS
 
 
 @pytest.mark.asyncio
-async def test_discover_candidate_urls_fetches_and_caches(tmp_path: Path) -> None:
-    settings = Settings(output_dir=tmp_path, max_links_inspected=2)
+async def test_discover_candidate_urls_fetches_and_caches(
+    discovery_env: tuple[Settings, SearchHitCache],
+) -> None:
+    settings, cache = discovery_env
     payload = {
         "data": {
             "children": [
@@ -79,7 +93,6 @@ async def test_discover_candidate_urls_fetches_and_caches(tmp_path: Path) -> Non
         }
     }
     client = _RecordingClient(payload)
-    cache = SearchHitCache(settings, ttl=timedelta(days=3))
 
     first_result = await discover_candidate_urls(
         "prompt",
@@ -90,10 +103,7 @@ async def test_discover_candidate_urls_fetches_and_caches(tmp_path: Path) -> Non
     )
 
     assert client.calls == 1
-    assert first_result == [
-        "https://example.com/discussion",
-        "https://www.reddit.com/r/localllama/comments/xyz/discussion/",
-    ]
+    assert tuple(first_result) == _DISCOVERED_URLS
 
     cached_result = await discover_candidate_urls(
         "prompt",
@@ -0,0 +1,293 @@
+"""Tests for the HTTP fetch helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+import httpx
+import pytest
+
+from scolar.config import Settings
+from scolar.fetcher import (
+    _decode_body,
+    _is_reddit_url,
+    _normalize_reddit_json_url,
+    _parse_reddit_comment,
+    fetch_html,
+    fetch_reddit,
+)
+
+
+@pytest.fixture
+def fetch_settings(settings: Settings) -> Settings:
+    """Shared test settings that allow one retry with a short backoff."""
+
+    return settings.model_copy(update={"request_retries": 1, "request_backoff": 0.5})
+
+
+@pytest.mark.asyncio
+async def test_fetch_html_honours_retry_after_on_429(
+    fetch_settings: Settings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A throttled response should delay the retry by the server's Retry-After."""
+
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr("scolar.fetcher.asyncio.sleep", fake_sleep)
+
+    responses = iter(
+        [
+            httpx.Response(429, headers={"retry-after": "7"}),
+            httpx.Response(
+                200, headers={"content-type": "text/html"}, text="<p>ok</p>"
+            ),
+        ]
+    )
+    transport = httpx.MockTransport(lambda request: next(responses))
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        html = await fetch_html("https://example.com", client, fetch_settings)
+
+    assert html == "<p>ok</p>"
+    assert sleeps == [7.0]
+
+
+@pytest.mark.asyncio
+async def test_fetch_html_caps_retry_delay(
+    fetch_settings: Settings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Excessive Retry-After values and backoff growth should be capped."""
+
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr("scolar.fetcher.asyncio.sleep", fake_sleep)
+
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(503, headers={"retry-after": "3600"})
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        html = await fetch_html(
+            "https://example.com",
+            client,
+            fetch_settings.model_copy(update={"request_retries": 2}),
+        )
+
+    assert html is None
+    assert sleeps == [30.0, 30.0]
+
+
+@pytest.mark.asyncio
+async def test_fetch_html_releases_semaphore_during_backoff(
+    fetch_settings: Settings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Retry backoff must not hold a fetch slot that other URLs could use."""
+
+    semaphore = asyncio.Semaphore(1)
+    locked_while_sleeping: list[bool] = []
+
+    async def fake_sleep(delay: float) -> None:
+        locked_while_sleeping.append(semaphore.locked())
+
+    monkeypatch.setattr("scolar.fetcher.asyncio.sleep", fake_sleep)
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(500))
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        html = await fetch_html(
+            "https://example.com",
+            client,
+            fetch_settings.model_copy(update={"request_retries": 2}),
+            semaphore=semaphore,
+        )
+
+    assert html is None
+    assert locked_while_sleeping == [False, False]
+
+
+@pytest.mark.asyncio
+async def test_fetch_html_decodes_with_declared_charset(
+    fetch_settings: Settings,
+) -> None:
+    """Bodies should be decoded with the charset from the content-type header."""
+
+    body = "<p>Größe</p>".encode("latin-1")
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            200,
+            headers={"content-type": "text/html; charset=ISO-8859-1"},
+            content=body,
+        )
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        html = await fetch_html("https://example.com", client, fetch_settings)
+
+    assert html == "<p>Größe</p>"
+
+
+@pytest.mark.asyncio
+async def test_fetch_reddit_parses_thread_listing(fetch_settings: Settings) -> None:
+    """Reddit thread JSON should be parsed into a post with nested comments."""
+
+    def comment(identifier: str, replies: list[dict]) -> dict:
+        return {
+            "kind": "t1",
+            "data": {
+                "id": identifier,
+                "author": f"user-{identifier}",
+                "score": 1,
+                "body_html": f"<p>{identifier}</p>",
+                "replies": {"data": {"children": replies}} if replies else "",
+            },
+        }
+
+    payload = [
+        {
+            "data": {
+                "children": [
+                    {
+                        "data": {
+                            "id": "post",
+                            "title": "Thread",
+                            "author": "op",
+                            "score": 10,
+                            "selftext_html": "<p>Body</p>",
+                        }
+                    }
+                ]
+            }
+        },
+        {"data": {"children": [comment("a", [comment("b", [])]), {"kind": "more"}]}},
+    ]
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(200, json=payload)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        thread = await fetch_reddit(
+            "https://www.reddit.com/r/test/comments/abc/thread",
+            client,
+            fetch_settings,
+        )
+
+    assert requested == ["https://www.reddit.com/r/test/comments/abc/thread/.json"]
+    assert thread is not None
+    assert thread.title == "Thread"
+    assert [c.identifier for c in thread.comments] == ["a"]
+    assert [c.identifier for c in thread.comments[0].children] == ["b"]
+
+
+def test_parse_reddit_comment_handles_deep_threads() -> None:
+    """Reply chains deeper than the recursion limit should parse iteratively."""
+
+    depth = sys.getrecursionlimit() + 100
+    payload: dict = {"id": str(depth), "replies": ""}
+    for index in range(depth - 1, -1, -1):
+        payload = {
+            "id": str(index),
+            "replies": {"data": {"children": [{"kind": "t1", "data": payload}]}},
+        }
+
+    node = _parse_reddit_comment(payload)
+    seen = 0
+    while node.children:
+        (node,) = node.children
+        seen += 1
+
+    assert seen == depth
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://www.reddit.com/r/LocalLLaMA/comments/abc/x/", True),
+        ("https://old.reddit.com/r/LocalLLaMA/", True),
+        ("https://reddit.com/r/LocalLLaMA", True),
+        ("https://user@WWW.Reddit.com:443/r/x", True),
+        ("https://reddit.com?x=1", True),
+        ("https://reddit.com#top", True),
+        ("https://notreddit.com/r/x", False),
+        ("https://example.com/reddit.com", False),
+    ],
+)
+def test_is_reddit_url(url: str, expected: bool) -> None:
+    """Only reddit.com and its subdomains should be treated as Reddit threads."""
+
+    assert _is_reddit_url(url) is expected
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        (
+            "https://www.reddit.com/r/x/comments/abc/title",
+            "https://www.reddit.com/r/x/comments/abc/title/.json",
+        ),
+        (
+            "https://www.reddit.com/r/x/comments/abc/title/?utm=1#top",
+            "https://www.reddit.com/r/x/comments/abc/title/.json",
+        ),
+        (
+            "https://www.reddit.com/r/x/comments/abc/title.json",
+            "https://www.reddit.com/r/x/comments/abc/title.json",
+        ),
+        ("www.reddit.com/r/x", "https://www.reddit.com/r/x/.json"),
+        ("https://reddit.com?x=1", "https://reddit.com/.json"),
+        ("https://www.reddit.com#top", "https://www.reddit.com/.json"),
+    ],
+)
+def test_normalize_reddit_json_url(url: str, expected: str) -> None:
+    """Thread URLs should map to their JSON endpoint without query or fragment."""
+
+    assert _normalize_reddit_json_url(url) == expected
+
+
+@pytest.mark.asyncio
+async def test_fetch_html_falls_back_to_utf8_for_unknown_charset(
+    fetch_settings: Settings,
+) -> None:
+    """An unrecognised charset label should not abort the fetch."""
+
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            200,
+            headers={"content-type": 'text/html; charset="x-made-up"'},
+            content="<p>café</p>".encode(),
+        )
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        html = await fetch_html("https://example.com", client, fetch_settings)
+
+    assert html == "<p>café</p>"
+
+
+@pytest.mark.asyncio
+async def test_fetch_html_matches_mixed_case_charset_parameter(
+    fetch_settings: Settings,
+) -> None:
+    """The charset parameter name should match regardless of its case."""
+
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            200,
+            headers={"content-type": "text/html; Charset=ISO-8859-1"},
+            content="<p>Größe</p>".encode("latin-1"),
+        )
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        html = await fetch_html("https://example.com", client, fetch_settings)
+
+    assert html == "<p>Größe</p>"
+    assert _decode_body(b"caf\xe9", "text/html; CHARSET=latin-1") == "café"
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import cast
 
+import orjson
 import pytest
 
 import httpx
@@ -23,14 +25,14 @@ from scolar.models import (
     RecommendedLink,
     Score,
 )
-from scolar.pipeline import gather_pages
+from scolar.pipeline import ProcessedPage, gather_pages
 
 
-@dataclass
+@dataclass(slots=True)
 class _FakeResponse:
     """Minimal stand-in for httpx.Response used in fetcher."""
 
-    text: str
+    content: bytes
     headers: dict[str, str]
 
     def raise_for_status(self) -> None:
@@ -41,7 +43,7 @@ class _FakeHTTPClient:
     """Async HTTP client that returns pre-baked HTML payloads keyed by URL."""
 
     def __init__(self, mapping: dict[str, str]) -> None:
-        self._mapping = mapping
+        self.mapping = mapping
         self.requested: list[str] = []
         self.sent_headers: list[dict[str, str] | None] = []
 
@@ -54,22 +56,24 @@ class _FakeHTTPClient:
     ) -> _FakeResponse:
         self.requested.append(url)
         self.sent_headers.append(headers)
-        html = self._mapping[url]
-        return _FakeResponse(text=html, headers={"content-type": "text/html"})
+        html = self.mapping[url]
+        return _FakeResponse(
+            content=html.encode("utf-8"), headers={"content-type": "text/html"}
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class _FakeLLMResponse:
     output_text: str
 
 
 class _FakeLLMResponses:
     def __init__(self, outputs: Iterable[str]) -> None:
-        self._outputs = list(outputs)
+        self.outputs = deque(outputs)
         self.calls = 0
 
     async def create(self, **_kwargs) -> _FakeLLMResponse:
-        output = self._outputs[self.calls]
+        output = self.outputs.popleft()
         self.calls += 1
         return _FakeLLMResponse(output_text=output)
 
@@ -85,57 +89,82 @@ class _FakeLLMClient:
         self.closed = True
 
 
-def _make_settings(output_dir: Path) -> Settings:
-    return Settings(
-        fetch_concurrency=3,
-        request_timeout=10.0,
-        request_retries=0,
-        request_backoff=0.0,
-        user_agent="TestAgent",
-        output_dir=output_dir,
-        max_markdown_chars=10_000,
-        max_links_inspected=10,
-        max_recommended_links=3,
-        openai_model="mock-model",
-        openai_temperature=0.0,
-        openai_timeout=10.0,
-        llm_concurrency=2,
-        final_answer_max_pages=5,
-        final_answer_excerpt_chars=1_500,
-        cache_ttl_hours=72,
-    )
+_HAPPY_LLM_OUTPUT = {
+    "summary": "Concise summary of the page.",
+    "technical_depth": {
+        "rating": 4,
+        "justification": "Covers implementation details.",
+    },
+    "prompt_fit": {"rating": 5, "justification": "Directly answers the prompt."},
+    "recommended_links": [
+        {
+            "title": "Follow-up",
+            "url": "https://example.com/follow-up",
+            "reason": "Provides additional architecture guidance.",
+        }
+    ],
+}
+_HAPPY_LLM_OUTPUT_JSON = orjson.dumps(_HAPPY_LLM_OUTPUT).decode()
+_HAPPY_HTML = """
+<html><head><title>Example Title</title></head>
+<body><p>Sample content paragraph.</p><a href='https://example.com/next'>Next</a></body>
+</html>
+"""
+
+# Shared between tests; the pipeline only reads fetched threads.
+_REDDIT_THREAD = RedditThread(
+    identifier="abc",
+    url="https://www.reddit.com/r/test/comments/abc/thread/",
+    title="Sample Thread",
+    author="thread_op",
+    body_html="<p>OP body</p>",
+    score=12,
+    comments=[
+        RedditComment(
+            identifier="c1",
+            author="commenter",
+            body_html="<p>First comment</p>",
+            score=5,
+            children=[],
+        )
+    ],
+)
+_REDDIT_LLM_OUTPUT_JSON = orjson.dumps(
+    {
+        "summary": "Summary",
+        "technical_depth": {"rating": 3, "justification": "Explains details."},
+        "prompt_fit": {"rating": 4, "justification": "Relevant."},
+        "recommended_links": [],
+    }
+).decode()
+_REFRESHED_LLM_OUTPUT_JSON = orjson.dumps(
+    {
+        "summary": "New summary",
+        "technical_depth": {"rating": 5, "justification": "Very deep"},
+        "prompt_fit": {"rating": 4, "justification": "Quite relevant"},
+        "recommended_links": [],
+    }
+).decode()
+
+
+@pytest.fixture
+def fake_clients() -> tuple[_FakeHTTPClient, _FakeLLMClient]:
+    """Empty fake clients; tests register pages and model outputs as needed."""
+
+    return _FakeHTTPClient({}), _FakeLLMClient([])
 
 
 @pytest.mark.asyncio
-async def test_gather_pages_happy_path(tmp_path: Path) -> None:
+async def test_gather_pages_happy_path(
+    settings: Settings, fake_clients: tuple[_FakeHTTPClient, _FakeLLMClient]
+) -> None:
     """The pipeline should persist markdown and return a populated assessment."""
 
     url = "https://example.com/article"
-    html = """
-    <html><head><title>Example Title</title></head>
-    <body><p>Sample content paragraph.</p><a href='https://example.com/next'>Next</a></body>
-    </html>
-    """
-    fake_http_client = _FakeHTTPClient({url: html})
-
-    llm_output = {
-        "summary": "Concise summary of the page.",
-        "technical_depth": {
-            "rating": 4,
-            "justification": "Covers implementation details.",
-        },
-        "prompt_fit": {"rating": 5, "justification": "Directly answers the prompt."},
-        "recommended_links": [
-            {
-                "title": "Follow-up",
-                "url": "https://example.com/follow-up",
-                "reason": "Provides additional architecture guidance.",
-            }
-        ],
-    }
-    fake_llm_client = _FakeLLMClient([json_dumps(llm_output)])
+    fake_http_client, fake_llm_client = fake_clients
+    fake_http_client.mapping[url] = _HAPPY_HTML
 
-    settings = _make_settings(tmp_path)
+    fake_llm_client.responses.outputs.append(_HAPPY_LLM_OUTPUT_JSON)
 
     results = await gather_pages(
         [url],
@@ -149,7 +178,7 @@ async def test_gather_pages_happy_path(tmp_path: Path) -> None:
     processed = results[0]
 
     assert processed.page.url == url
-    assert processed.assessment.summary == llm_output["summary"]
+    assert processed.assessment.summary == _HAPPY_LLM_OUTPUT["summary"]
     assert processed.assessment.technical_depth.rating == 4
     assert processed.assessment.prompt_fit.rating == 5
 
@@ -163,15 +192,18 @@ async def test_gather_pages_happy_path(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_gather_pages_skips_when_llm_fails(tmp_path: Path) -> None:
+async def test_gather_pages_skips_when_llm_fails(
+    settings: Settings,
+    tmp_path: Path,
+    fake_clients: tuple[_FakeHTTPClient, _FakeLLMClient],
+) -> None:
     """If the LLM returns invalid JSON the page should be skipped after markdown persistence."""
 
     url = "https://example.com/bad"
     html = "<html><body><p>Content</p></body></html>"
-    fake_http_client = _FakeHTTPClient({url: html})
-    fake_llm_client = _FakeLLMClient(["not json"])
-
-    settings = _make_settings(tmp_path)
+    fake_http_client, fake_llm_client = fake_clients
+    fake_http_client.mapping[url] = html
+    fake_llm_client.responses.outputs.append("not json")
 
     results = await gather_pages(
         [url],
@@ -190,26 +222,9 @@ async def test_gather_pages_skips_when_llm_fails(tmp_path: Path) -> None:
 
 @pytest.mark.asyncio
 async def test_gather_pages_processes_reddit_thread(
-    monkeypatch, tmp_path: Path
+    monkeypatch, settings: Settings
 ) -> None:
-    reddit_url = "https://www.reddit.com/r/test/comments/abc/thread/"
-    thread = RedditThread(
-        identifier="abc",
-        url=reddit_url,
-        title="Sample Thread",
-        author="thread_op",
-        body_html="<p>OP body</p>",
-        score=12,
-        comments=[
-            RedditComment(
-                identifier="c1",
-                author="commenter",
-                body_html="<p>First comment</p>",
-                score=5,
-                children=[],
-            )
-        ],
-    )
+    reddit_url = _REDDIT_THREAD.url
 
     async def _fake_fetch_resource(
         url: str,
@@ -223,21 +238,13 @@ async def test_gather_pages_processes_reddit_thread(
         assert isinstance(settings, Settings)
         assert isinstance(semaphore, asyncio.Semaphore)
         assert semaphore._value == settings.fetch_concurrency
-        return thread
+        return _REDDIT_THREAD
 
     monkeypatch.setattr("scolar.pipeline.fetch_resource", _fake_fetch_resource)
 
     fake_http_client = _FakeHTTPClient({})
 
-    llm_output = {
-        "summary": "Summary",
-        "technical_depth": {"rating": 3, "justification": "Explains details."},
-        "prompt_fit": {"rating": 4, "justification": "Relevant."},
-        "recommended_links": [],
-    }
-    fake_llm_client = _FakeLLMClient([json_dumps(llm_output)])
-
-    settings = _make_settings(tmp_path)
+    fake_llm_client = _FakeLLMClient([_REDDIT_LLM_OUTPUT_JSON])
 
     results = await gather_pages(
         [reddit_url],
@@ -260,17 +267,12 @@ async def test_gather_pages_processes_reddit_thread(
     assert fake_http_client.requested == []
 
 
-def json_dumps(obj: dict) -> str:
-    import json
-
-    return json.dumps(obj)
-
-
 @pytest.mark.asyncio
-async def test_gather_pages_uses_cache_within_ttl(tmp_path: Path) -> None:
+async def test_gather_pages_uses_cache_within_ttl(
+    settings: Settings, tmp_path: Path
+) -> None:
     """Cached pages fetched within the TTL should be reused without new HTTP or LLM calls."""
 
-    settings = _make_settings(tmp_path)
     url = "https://example.com/cached"
 
     markdown_path = tmp_path / "cached.md"
@@ -321,10 +323,11 @@ async def test_gather_pages_uses_cache_within_ttl(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_gather_pages_refresh_flag_bypasses_cache(tmp_path: Path) -> None:
+async def test_gather_pages_refresh_flag_bypasses_cache(
+    settings: Settings, tmp_path: Path
+) -> None:
     """The refresh flag should force new network and LLM work even when cache exists."""
 
-    settings = _make_settings(tmp_path)
     url = "https://example.com/refresh"
 
     markdown_path = tmp_path / "refresh.md"
@@ -355,16 +358,7 @@ async def test_gather_pages_refresh_flag_bypasses_cache(tmp_path: Path) -> None:
     """
     fake_http_client = _FakeHTTPClient({url: html})
 
-    llm_output = {
-        "summary": "New summary",
-        "technical_depth": {
-            "rating": 5,
-            "justification": "Very deep",
-        },
-        "prompt_fit": {"rating": 4, "justification": "Quite relevant"},
-        "recommended_links": [],
-    }
-    fake_llm_client = _FakeLLMClient([json_dumps(llm_output)])
+    fake_llm_client = _FakeLLMClient([_REFRESHED_LLM_OUTPUT_JSON])
 
     results = await gather_pages(
         [url],
@@ -381,3 +375,81 @@ async def test_gather_pages_refresh_flag_bypasses_cache(tmp_path: Path) -> None:
     processed = results[0]
     assert processed.assessment.summary == "New summary"
     assert processed.page.title == "New Title"
+
+
+def _scripted_process_url(
+    outcomes: dict[str, float | BaseException],
+) -> Callable[..., Awaitable[ProcessedPage]]:
+    """Stand-in for ``process_url`` that raises or sleeps per URL, then succeeds."""
+
+    async def _fake_process_url(
+        url: str, *_args: object, **_kwargs: object
+    ) -> ProcessedPage:
+        outcome = outcomes[url]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        await asyncio.sleep(outcome)
+        page = PageContent(
+            url=url, title=url, markdown="Body", links=[], truncated=False
+        )
+        assessment = PageAssessment(
+            summary="Summary",
+            technical_depth=Score(rating=3, justification="Depth"),
+            prompt_fit=Score(rating=3, justification="Fit"),
+            recommended_links=[],
+        )
+        return ProcessedPage(page=page, assessment=assessment)
+
+    return _fake_process_url
+
+
+@pytest.mark.asyncio
+async def test_gather_pages_keeps_input_order_when_a_url_errors(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    """Results should follow input order even if tasks finish out of order or fail."""
+
+    urls = [
+        "https://example.com/slow",
+        "https://example.com/boom",
+        "https://example.com/fast",
+    ]
+    monkeypatch.setattr(
+        "scolar.pipeline.process_url",
+        _scripted_process_url(
+            {urls[0]: 0.02, urls[1]: RuntimeError("unexpected failure"), urls[2]: 0.0}
+        ),
+    )
+
+    results = await gather_pages(
+        urls,
+        research_prompt="Prompt",
+        settings=settings,
+        http_client=cast(httpx.AsyncClient, _FakeHTTPClient({})),
+        llm_client=cast(AsyncOpenAI, _FakeLLMClient([])),
+    )
+
+    assert [item.page.url for item in results] == [urls[0], urls[2]]
+
+
+@pytest.mark.asyncio
+async def test_gather_pages_keeps_finished_pages_when_a_task_is_cancelled(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    """A cancelled per-URL task should be logged and skipped, not abort the batch."""
+
+    urls = ["https://example.com/cancelled", "https://example.com/done"]
+    monkeypatch.setattr(
+        "scolar.pipeline.process_url",
+        _scripted_process_url({urls[0]: asyncio.CancelledError(), urls[1]: 0.0}),
+    )
+
+    results = await gather_pages(
+        urls,
+        research_prompt="Prompt",
+        settings=settings,
+        http_client=cast(httpx.AsyncClient, _FakeHTTPClient({})),
+        llm_client=cast(AsyncOpenAI, _FakeLLMClient([])),
+    )
+
+    assert [item.page.url for item in results] == [urls[1]]
@@ -0,0 +1,96 @@
+"""Tests for HTML to page-content parsing."""
+
+from __future__ import annotations
+
+from scolar.config import Settings
+from scolar.parser import parse_html
+
+
+def test_parse_html_extracts_title_links_and_body(settings: Settings) -> None:
+    """Head noise and inline scripts should not leak into the parsed page."""
+
+    html = (
+        "<html><head><title> Guide </title><style>h1{}</style>"
+        "<meta name='x' content='y'></head>"
+        "<body><h1>Heading</h1><script>alert(1)</script>"
+        "<p>Read <a href='/next'>the next part</a>.</p></body></html>"
+    )
+
+    page = parse_html("https://example.com/doc", html, settings)
+
+    assert page.title == "Guide"
+    assert [(link.title, link.url) for link in page.links] == [
+        ("the next part", "https://example.com/next")
+    ]
+    assert "Heading" in page.markdown
+    assert "alert" not in page.markdown
+    assert "h1{}" not in page.markdown
+
+
+def test_parse_html_does_not_leak_state_between_pages(settings: Settings) -> None:
+    """Consecutive pages should not share converted text or list nesting."""
+
+    first = parse_html("https://example.com/a", "<ul><li>first", settings)
+    second = parse_html("https://example.com/b", "<p>second</p>", settings)
+
+    assert "first" in first.markdown
+    assert second.markdown == "second"
+
+
+def test_parse_html_does_not_carry_abbreviations_to_later_pages(
+    settings: Settings,
+) -> None:
+    """Abbreviation definitions from one page must not be appended to the next."""
+
+    parse_html(
+        "https://example.com/a", '<p><abbr title="Key Value">KV</abbr></p>', settings
+    )
+    page = parse_html("https://example.com/b", "<p>Unrelated page</p>", settings)
+
+    assert page.markdown == "Unrelated page"
+
+
+def test_parse_html_keeps_first_anchor_text_per_url(settings: Settings) -> None:
+    """Repeated links to one URL should collapse to the first occurrence."""
+
+    html = (
+        "<body><a href='/a'>Intro</a><a href='/b'>Other</a>"
+        "<a href='https://example.com/a'>Read the intro</a></body>"
+    )
+
+    page = parse_html("https://example.com/", html, settings)
+
+    assert [(link.title, link.url) for link in page.links] == [
+        ("Intro", "https://example.com/a"),
+        ("Other", "https://example.com/b"),
+    ]
+
+
+def test_parse_html_truncates_at_last_line_break(settings: Settings) -> None:
+    """Oversized pages should be cut back to the last complete line."""
+
+    settings = settings.model_copy(update={"max_markdown_chars": 1000})
+    html = "<body>" + "".join(f"<p>{'x' * 80}</p>" for _ in range(40)) + "</body>"
+
+    page = parse_html("https://example.com/", html, settings)
+
+    assert page.truncated
+    assert len(page.markdown) <= 1000
+    assert {len(line) for line in page.markdown.splitlines()} <= {0, 80}
+
+
+def test_parse_html_skips_fragment_and_handler_links(settings: Settings) -> None:
+    """In-page anchors, script handlers and mail links should not become links."""
+
+    html = (
+        "<body><a href='#top'>Top</a><a href='javascript:void(0)'>JS</a>"
+        "<a href='mailto:me@example.com'>Mail</a>"
+        "<a href=' https://other.example/x '>Other</a><a href='docs'>Docs</a></body>"
+    )
+
+    page = parse_html("https://example.com/a/", html, settings)
+
+    assert [link.url for link in page.links] == [
+        "https://other.example/x",
+        "https://example.com/a/docs",
+    ]
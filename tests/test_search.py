@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
+from collections import deque
 from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import cast
 
+import orjson
 import pytest
 
 from openai import AsyncOpenAI
@@ -17,18 +18,20 @@ from scolar.search import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class _FakeLLMResponse:
     output_text: str
 
 
 class _FakeLLMResponses:
     def __init__(self, outputs: Iterable[str]) -> None:
-        self._outputs = list(outputs)
+        self._outputs = deque(outputs)
         self.calls = 0
+        self.requests: list[dict[str, object]] = []
 
-    async def create(self, **_kwargs) -> _FakeLLMResponse:  # noqa: ANN003
-        output = self._outputs[self.calls]
+    async def create(self, **kwargs: object) -> _FakeLLMResponse:
+        self.requests.append(kwargs)
+        output = self._outputs.popleft()
         self.calls += 1
         return _FakeLLMResponse(output_text=output)
 
@@ -50,7 +53,7 @@ async def test_generate_search_queries_parses_payload() -> None:
         "site_filters": ["site:nature.com", "filetype:pdf"],
         "notes": "Mix roadmaps with funding outlook keywords.",
     }
-    fake_client = _FakeLLMClient([json.dumps(payload)])
+    fake_client = _FakeLLMClient([orjson.dumps(payload).decode()])
     settings = Settings()
 
     result = await generate_search_queries(
@@ -94,7 +97,7 @@ async def test_generate_search_queries_deduplicates_and_limits() -> None:
         ],
         "notes": "",
     }
-    fake_client = _FakeLLMClient([json.dumps(payload)])
+    fake_client = _FakeLLMClient([orjson.dumps(payload).decode()])
     settings = Settings(final_answer_max_pages=3)
 
     result = await generate_search_queries(
@@ -112,6 +115,22 @@ async def test_generate_search_queries_deduplicates_and_limits() -> None:
     assert result.notes is None
 
 
+@pytest.mark.asyncio
+async def test_generate_search_queries_prompt_keeps_multiline_research_prompt() -> None:
+    fake_client = _FakeLLMClient([orjson.dumps({"primary_query": "query"}).decode()])
+
+    await generate_search_queries(
+        cast(AsyncOpenAI, fake_client), Settings(), "First line\n  indented detail"
+    )
+
+    (request,) = fake_client.responses.requests
+    messages = cast(list[dict[str, str]], request["input"])
+    user_prompt = messages[1]["content"]
+    assert user_prompt.startswith("Research prompt:\nFirst line\n  indented detail\n")
+    assert '"primary_query": "string"' in user_prompt
+    assert "up to 5 diverse variations" in user_prompt
+
+
 def test_render_search_expansion_outputs_sections() -> None:
     expansion = SearchExpansion(
         primary_query="llm agent evaluation",
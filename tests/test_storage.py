@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 from pathlib import Path
 
@@ -13,11 +14,9 @@ from scolar.storage import store_markdown
 
 
 @pytest.mark.asyncio
-async def test_store_markdown_generates_unique_slugs(tmp_path: Path) -> None:
+async def test_store_markdown_generates_unique_slugs(settings: Settings) -> None:
     """Markdown files from duplicate titles should not overwrite one another."""
 
-    settings = Settings(output_dir=tmp_path)
-
     page_one = PageContent(
         url="https://example.com/posts/first",
         title="Shared Title",
@@ -33,8 +32,9 @@ async def test_store_markdown_generates_unique_slugs(tmp_path: Path) -> None:
         truncated=False,
     )
 
-    path_one = await store_markdown(page_one, settings)
-    path_two = await store_markdown(page_two, settings)
+    path_one, path_two = await asyncio.gather(
+        store_markdown(page_one, settings), store_markdown(page_two, settings)
+    )
 
     assert path_one != path_two
     assert path_one.exists()
@@ -44,11 +44,9 @@ async def test_store_markdown_generates_unique_slugs(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_store_markdown_slug_includes_hash_suffix(tmp_path: Path) -> None:
+async def test_store_markdown_slug_includes_hash_suffix(settings: Settings) -> None:
     """Stored filenames should carry a deterministic hash suffix."""
 
-    settings = Settings(output_dir=tmp_path)
-
     page = PageContent(
         url="https://sub.example.com/path/to/page",
         title="",
@@ -64,11 +62,9 @@ async def test_store_markdown_slug_includes_hash_suffix(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_store_markdown_slug_respects_length_limit(tmp_path: Path) -> None:
+async def test_store_markdown_slug_respects_length_limit(settings: Settings) -> None:
     """Generated slugs should not exceed the maximum configured length."""
 
-    settings = Settings(output_dir=tmp_path)
-
     long_title = "Very Long Title " * 10
     page = PageContent(
         url="https://example.com/very/long/title",
@@ -83,11 +79,9 @@ async def test_store_markdown_slug_respects_length_limit(tmp_path: Path) -> None
 
 
 @pytest.mark.asyncio
-async def test_store_markdown_idempotent_for_same_url(tmp_path: Path) -> None:
+async def test_store_markdown_idempotent_for_same_url(settings: Settings) -> None:
     """Calling store_markdown twice for the same URL should reuse the slug."""
 
-    settings = Settings(output_dir=tmp_path)
-
     page = PageContent(
         url="https://repeat.example.com/item",
         title="Repeated",
@@ -102,3 +96,73 @@ async def test_store_markdown_idempotent_for_same_url(tmp_path: Path) -> None:
 
     assert first == second
     assert second.read_text(encoding="utf-8") == "Updated"
+
+
+@pytest.mark.asyncio
+async def test_store_markdown_slug_folds_accents_and_drops_symbols(
+    settings: Settings,
+) -> None:
+    """Titles should reduce to ASCII slug characters, folding accented letters."""
+
+    page = PageContent(
+        url="https://example.com/cafe",
+        title="Café Guide: 日本 & More!",
+        markdown="Body",
+        links=[],
+        truncated=False,
+    )
+
+    path = await store_markdown(page, settings)
+
+    assert re.fullmatch(r"cafe-guide---more-[0-9a-f]{8}", path.stem)
+
+
+@pytest.mark.asyncio
+async def test_store_markdown_creates_output_dir_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeated writes into one output directory should only mkdir it once."""
+
+    settings = Settings(output_dir=tmp_path / "out")
+    calls: list[Path] = []
+    original_mkdir = Path.mkdir
+
+    def tracking_mkdir(self: Path, *args: object, **kwargs: object) -> None:
+        calls.append(self)
+        original_mkdir(self, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(Path, "mkdir", tracking_mkdir)
+
+    for index in range(3):
+        page = PageContent(
+            url=f"https://example.com/{index}",
+            title=f"Page {index}",
+            markdown="Body",
+            links=[],
+            truncated=False,
+        )
+        path = await store_markdown(page, settings)
+        assert path.read_text(encoding="utf-8") == "Body"
+
+    assert calls == [settings.output_dir]
+
+
+@pytest.mark.asyncio
+async def test_store_markdown_recreates_deleted_output_dir(settings: Settings) -> None:
+    """A removed output directory should be recreated even after it was memoized."""
+
+    settings = settings.model_copy(update={"output_dir": settings.output_dir / "gone"})
+    page = PageContent(
+        url="https://example.com/recreate",
+        title="Recreate",
+        markdown="Body",
+        links=[],
+        truncated=False,
+    )
+
+    first = await store_markdown(page, settings)
+    first.unlink()
+    settings.output_dir.rmdir()
+    second = await store_markdown(page, settings)
+
+    assert second.read_text(encoding="utf-8") == "Body"
@@ -0,0 +1,70 @@
+"""Tests for per-page assessment requests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import cast
+
+import orjson
+import pytest
+from openai import AsyncOpenAI
+
+from scolar.config import Settings
+from scolar.models import LinkInfo, PageContent
+from scolar.summarizer import SYSTEM_PROMPT, assess_page
+
+
+@dataclass(slots=True)
+class _FakeLLMResponse:
+    output_text: str
+
+
+class _FakeLLMResponses:
+    def __init__(self, output: str) -> None:
+        self._output = output
+        self.requests: list[dict[str, object]] = []
+
+    async def create(self, **kwargs: object) -> _FakeLLMResponse:
+        self.requests.append(kwargs)
+        return _FakeLLMResponse(output_text=self._output)
+
+
+class _FakeLLMClient:
+    def __init__(self, output: str) -> None:
+        self.responses = _FakeLLMResponses(output)
+
+
+@pytest.mark.asyncio
+async def test_assess_page_sends_unindented_prompt_and_parses_reply() -> None:
+    """The page prompt should keep content flush-left and parse the JSON reply."""
+
+    reply = {
+        "summary": "Summary",
+        "technical_depth": {"rating": 4, "justification": "Detailed"},
+        "prompt_fit": {"rating": 5, "justification": "On topic"},
+        "recommended_links": [],
+    }
+    client = _FakeLLMClient(orjson.dumps(reply).decode())
+    page = PageContent(
+        url="https://example.com/doc",
+        title="Doc",
+        markdown="# Heading\n\nBody line",
+        links=[LinkInfo(title="Next", url="https://example.com/next")],
+        truncated=True,
+    )
+
+    assessment = await assess_page(
+        cast(AsyncOpenAI, client), Settings(), "Line one\nLine two", page
+    )
+
+    assert assessment is not None
+    assert assessment.technical_depth.rating == 4
+    (request,) = client.responses.requests
+    system, user = cast(list[dict[str, str]], request["input"])
+    assert system == {"role": "system", "content": SYSTEM_PROMPT}
+    assert user["content"].startswith("Research prompt:\nLine one\nLine two\n\n")
+    assert (
+        "Page content (Markdown only) [TRUNCATED]:\n---\n# Heading" in user["content"]
+    )
+    assert '[{"title":"Next","url":"https://example.com/next"}]' in user["content"]
+    assert '\n  "summary": <80-120 word neutral summary>,' in user["content"]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+
 from scolar.fetcher import RedditComment, RedditThread
 from scolar.threads import clean_html_content, convert_to_thread_path
 
@@ -44,3 +46,41 @@ def test_convert_to_thread_path_nested_comments() -> None:
         "[1.1] user1: Comment 1",
         "[1.1.1] user2: Reply text",
     ]
+
+
+def test_convert_to_thread_path_handles_deep_and_sibling_replies() -> None:
+    depth = sys.getrecursionlimit() + 50
+    deepest = RedditComment(
+        identifier="leaf", author=None, body_html="", score=0, children=[]
+    )
+    node = deepest
+    for _ in range(depth - 1):
+        node = RedditComment(
+            identifier="c", author="deep", body_html="", score=0, children=[node]
+        )
+    sibling = RedditComment(
+        identifier="s", author="sib", body_html="<p>Second</p>", score=0, children=[]
+    )
+    thread = RedditThread(
+        identifier="abc",
+        url="https://www.reddit.com/r/test/comments/abc/thread/",
+        title="Thread Title",
+        author=None,
+        body_html="",
+        score=0,
+        comments=[node, sibling],
+    )
+
+    paths = convert_to_thread_path(thread)
+
+    assert paths[0] == "[1] Anonymous: Thread Title"
+    assert paths[1] == "[1.1] deep: "
+    assert paths[depth] == f"[1.1{'.1' * (depth - 1)}] Anonymous: "
+    assert paths[-1] == "[1.2] sib: Second"
+    assert len(paths) == depth + 2
+
+
+def test_clean_html_content_plain_text_fast_path_decodes_entities() -> None:
+    assert clean_html_content("Tom &amp;amp; Jerry\n  say&nbsp;hi") == (
+        "Tom & Jerry say hi"
+    )